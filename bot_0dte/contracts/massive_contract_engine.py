@@ -88,7 +88,7 @@ class MassiveContractEngine:
         new_expiry = get_expiry_for_symbol(self.symbol)
 
         if new_expiry != self.expiry:
-            logger.info(f"[OCC_EXPIRY_ROLL] {self.symbol} {self.expiry} → {new_expiry}")
+            logger.info("[OCC_EXPIRY_ROLL] %s %s → %s", self.symbol, self.expiry, new_expiry)
             self.expiry = new_expiry
             return True
         return False
@@ -180,7 +180,7 @@ class MassiveContractEngine:
 
             # forced refresh on stagnation
             if time.time() - self._last_price_change_ts >= self.STAGNATION_REFRESH_SEC:
-                logger.info(f"[OCC_STAGNATION] {self.symbol} forced refresh")
+                logger.info("[OCC_STAGNATION] %s forced refresh", self.symbol)
                 await self._refresh(price)
                 return
 
@@ -222,7 +222,7 @@ class MassiveContractEngine:
         self._initialized = True
         self._last_refresh_ts = time.monotonic()
 
-        logger.info(f"[OCC_INIT] {self.symbol} strikes={strikes} subs={len(occs)}")
+        logger.info("[OCC_INIT] %s strikes=%s subs=%d", self.symbol, strikes, len(occs))
         await self.ws.set_occ_subscriptions(occs)
 
         # 🔥 start hydration loop
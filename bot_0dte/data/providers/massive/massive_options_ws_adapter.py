@@ -19,6 +19,13 @@ from typing import Callable, List, Optional, Set
 
 import websockets
 
+# orjson (optional) decodes frames straight from bytes, several times
+# faster than json.loads on the NBBO firehose; same dict/list output.
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
@@ -157,7 +164,7 @@ class MassiveOptionsWSAdapter:
                             break
 
                         try:
-                            msgs = json.loads(raw)
+                            msgs = _loads(raw)
                         except Exception:
                             continue
 
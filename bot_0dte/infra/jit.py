@@ -0,0 +1,43 @@
+"""
+Optional Numba JIT.
+
+`njit` compiles with numba when it is installed (and not disabled via
+BOT_0DTE_DISABLE_JIT) and degrades to a no-op decorator otherwise, so
+kernels written as plain numeric Python run the same either way.
+Kernels take and write buffers (array.array / ndarray) and never touch
+dicts, strings or Python objects.
+"""
+
+import os
+
+# BOT_0DTE_DISABLE_JIT=1 skips importing numba altogether (no import cost,
+# no compile) for deployments where startup time matters more than
+# per-tick speed. Kernels then run as plain Python, same as without numba.
+JIT_DISABLED = os.getenv("BOT_0DTE_DISABLE_JIT", "").lower().strip() in ("1", "true", "yes")
+
+_numba_njit = None
+NUMBA_AVAILABLE = False
+
+if not JIT_DISABLED:
+    try:
+        from numba import njit as _numba_njit
+
+        NUMBA_AVAILABLE = True
+    except ImportError:  # pragma: no cover - depends on environment
+        pass
+
+
+def njit(*args, **kwargs):
+    """numba.njit when available, identity decorator otherwise."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+
+    # Bare @njit
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    # @njit(...) / @njit("signature", ...)
+    def _decorate(fn):
+        return fn
+
+    return _decorate
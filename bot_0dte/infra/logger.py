@@ -97,9 +97,10 @@ class StructuredLogger:
                     except asyncio.QueueEmpty:
                         break
 
-                # Write batch
+                # Write batch (deferred formatting happens here)
                 with open(self.path, "a") as f:
                     for item in buffer:
+                        item["iso"] = datetime.utcfromtimestamp(item["ts"]).isoformat()
                         f.write(json.dumps(item) + "\n")
                 buffer.clear()
 
@@ -161,9 +162,10 @@ class StructuredLogger:
             return
 
         # ---------- JSON record ----------
+        # "iso" is rendered from ts by the writer task, off the hot path
         record = {
             "ts": time.time(),
-            "iso": datetime.utcnow().isoformat(),
+            "iso": None,
             "level": level,
             "event": event,
         }
@@ -529,7 +529,7 @@ class Orchestrator:
             self.logger.log_event("management_convexity", {
                 "symbol": symbol,
                 "grade": grade,
-                "pnl_pct": round(entry_to_current * 100, 2),
+                "pnl_pct": entry_to_current * 100,
             })
             
             # Tier promotion
@@ -683,9 +683,9 @@ class Orchestrator:
             self.decision_log.log(
                 decision="ENTRY",
                 symbol=symbol,
-                reason=str(signal.regime),
-                convexity_score=float(signal.score),
-                tier=str(signal.grade),
+                reason=signal.regime,
+                convexity_score=signal.score,
+                tier=signal.grade,
                 price=float(price),
             )
             
@@ -765,8 +765,8 @@ class Orchestrator:
             decision="EXIT",
             symbol=symbol,
             reason=str(reason),
-            convexity_score=float(self.active_score or 0.0),
-            tier=str(self.active_grade or "L0"),
+            convexity_score=self.active_score or 0.0,
+            tier=self.active_grade or "L0",
             price=float(underlying_price),
         )
         
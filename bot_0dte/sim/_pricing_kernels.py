@@ -0,0 +1,115 @@
+"""
+Pricing kernels for SyntheticNBBOFeed.
+
+Buffer-in / buffer-out numeric functions: compiled by numba when it is
+installed (see bot_0dte.infra.jit), plain Python otherwise.
+
+Encoding:
+    • rights are ints (1 = call, 0 = put)
+    • randomness is passed in as uniform [0, 1) draws so kernels stay
+      RNG-free; `draws` holds 3 × n samples laid out as
+      [extrinsic noise | spread | iv noise]
+"""
+
+from array import array
+
+from bot_0dte.infra.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def price_chain(u, iv, sp_lo, sp_hi, strikes, is_call, draws, mid_out, half_out, iv_out):
+    """
+    Price one ATM grid.
+
+    mid  = max(0.05, intrinsic + iv × (1 ± 15%))
+    half = U(sp_lo, sp_hi) / 2
+    iv   = iv ± 0.02
+    """
+    n = len(strikes)
+    ext_lo = iv * 0.85
+    ext_rng = iv * 0.30
+    sp_rng = sp_hi - sp_lo
+
+    for i in range(n):
+        k = strikes[i]
+        intrinsic = u - k if is_call[i] else k - u
+        if intrinsic < 0.0:
+            intrinsic = 0.0
+
+        mid = intrinsic + ext_lo + ext_rng * draws[i]
+        if mid < 0.05:
+            mid = 0.05
+
+        mid_out[i] = mid
+        half_out[i] = 0.5 * (sp_lo + sp_rng * draws[n + i])
+        iv_out[i] = iv - 0.02 + 0.04 * draws[2 * n + i]
+
+
+@njit(cache=True, fastmath=True)
+def greeks_chain(u, strikes, is_call, delta_out, gamma_out):
+    """
+    Distance-based greek proxies for one grid.
+
+    delta = ±max(0.05, 0.45 - 0.12·|u - k|)   (sign by right)
+    gamma =  max(0.005, 0.03 - 0.01·|u - k|)
+    """
+    for i in range(len(strikes)):
+        dist = abs(u - strikes[i])
+
+        d = 0.45 - 0.12 * dist
+        if d < 0.05:
+            d = 0.05
+        delta_out[i] = d if is_call[i] else -d
+
+        g = 0.03 - 0.01 * dist
+        if g < 0.005:
+            g = 0.005
+        gamma_out[i] = g
+
+
+@njit(cache=True, fastmath=True)
+def update_flow_iv(flow_bias, iv_level, dt, r_break, r_trend, r_iv):
+    """
+    Branchless flow-bias / IV-level step.
+
+    Regimes (dt = |Δunderlying|):
+        breakout  dt > 0.20   flow += U(0.3, 0.8)
+        chop      dt < 0.05   flow *= 0.90
+        trend     otherwise   flow += U(-0.1, 0.1)
+
+        expand    dt > 0.15   iv += U(0.01, 0.03)
+        decay     otherwise   iv -= U(0.005, 0.015)
+
+    flow is clamped to [-3, 3], iv to [0.12, 0.45].
+    """
+    breakout = 1.0 if dt > 0.20 else 0.0       # select, not a branch
+    chop = 1.0 if dt < 0.05 else 0.0
+    trend = 1.0 - breakout - chop
+
+    flow = (
+        flow_bias * (1.0 - 0.10 * chop)
+        + breakout * (0.3 + 0.5 * r_break)
+        + trend * (-0.1 + 0.2 * r_trend)
+    )
+    flow = min(3.0, max(-3.0, flow))
+
+    expand = 1.0 if dt > 0.15 else 0.0
+    iv = iv_level + expand * (0.01 + 0.02 * r_iv) - (1.0 - expand) * (0.005 + 0.01 * r_iv)
+    iv = min(0.45, max(0.12, iv))
+
+    return flow, iv
+
+
+def _warmup():
+    """Force compilation at import so the first live tick pays no JIT cost."""
+    one = array("d", [0.0])
+    price_chain(
+        500.0, 0.22, 0.01, 0.04,
+        array("d", [500.0]), array("b", [1]), array("d", [0.5, 0.5, 0.5]),
+        one, array("d", [0.0]), array("d", [0.0]),
+    )
+    greeks_chain(500.0, array("d", [500.0]), array("b", [1]), one, array("d", [0.0]))
+    update_flow_iv(0.0, 0.22, 0.1, 0.5, 0.5, 0.5)
+
+
+_warmup()
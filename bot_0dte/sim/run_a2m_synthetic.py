@@ -6,6 +6,7 @@ import random
 from bot_0dte.sim.synthetic_mux import SyntheticMux
 from bot_0dte.sim.synthetic_underlying_feed import SyntheticUnderlyingFeed
 from bot_0dte.sim.synthetic_nbbo_feed import SyntheticNBBOFeed
+from bot_0dte.sim.synthetic_feed_driver import SyntheticFeedDriver
 
 from bot_0dte.orchestrator import Orchestrator
 from bot_0dte.execution.adapters.mock_exec import MockExecutionEngine
@@ -112,8 +113,11 @@ async def main():
     print(f"[SIM] Scenario: {args.scenario} (drift={scenario['drift']}, σ={scenario['volatility']})")
     print("[SIM] Running...\n")
 
-    task_under = asyncio.create_task(under.start())
-    task_nbbo = asyncio.create_task(nbbo.start())
+    # One driver task ticks both feeds (single timer)
+    driver = SyntheticFeedDriver()
+    driver.register(under)
+    driver.register(nbbo)
+    task_feeds = asyncio.create_task(driver.run())
 
     # Allow simulation to execute
     await asyncio.sleep(args.duration)
@@ -121,8 +125,7 @@ async def main():
     # ------------------------------------------------------------------
     # Shutdown feeds
     # ------------------------------------------------------------------
-    under.stop()
-    nbbo.stop()
+    driver.stop()
 
     await asyncio.sleep(0.25)
 
@@ -133,9 +136,9 @@ async def main():
     print("      • latency gating")
     print("      • premium / convexity filters\n")
 
-    task_under.cancel()
-    task_nbbo.cancel()
-    await asyncio.gather(task_under, task_nbbo, return_exceptions=True)
+    task_feeds.cancel()
+    await asyncio.gather(task_feeds, return_exceptions=True)
+    await mux.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import asyncio
+import heapq
+import logging
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SyntheticFeedDriver:
+    """
+    Single-task scheduler for synthetic feeds.
+
+    Instead of every feed running its own start() loop (one timer and one
+    context switch per feed per tick), feeds are registered here and one
+    task sleeps until the earliest deadline, then calls the due feeds'
+    tick_once() in-line.
+
+    A feed is anything with:
+        async tick_once() -> float   # seconds until its next tick
+        arm()                        # mark live (running -> True)
+        stop()                       # mark stopped (running -> False)
+        running                      # bool property
+        async flush()                # optional: push held-back output
+
+    flush() is awaited once per feed when run() returns, so batching feeds
+    do not lose their last partial batch on stop.
+
+    A feed whose tick_once() raises is logged, stopped and dropped; the
+    other feeds keep ticking.
+
+    Usage:
+        driver = SyntheticFeedDriver()
+        driver.register(under)
+        driver.register(nbbo)
+        task = asyncio.create_task(driver.run())
+        ...
+        driver.stop()
+    """
+
+    def __init__(self):
+        self._feeds: List = []
+        self._running = False
+
+    def register(self, feed):
+        """Add a feed; registration order breaks deadline ties."""
+        self._feeds.append(feed)
+
+    def stop(self):
+        self._running = False
+        for feed in self._feeds:
+            feed.stop()
+
+    async def run(self):
+        """Tick all registered feeds until stopped (or every feed stops)."""
+        self._running = True
+        loop = asyncio.get_running_loop()
+
+        t0 = loop.time()
+        heap: List[Tuple[float, int]] = []
+        for i, feed in enumerate(self._feeds):
+            feed.arm()
+            heap.append((t0, i))
+        heapq.heapify(heap)
+
+        feeds = self._feeds
+
+        while self._running and heap:
+            deadline, i = heap[0]
+
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            feed = feeds[i]
+            if not feed.running:
+                heapq.heappop(heap)        # stopped feed drops out
+                continue
+
+            try:
+                interval = await feed.tick_once()
+            except Exception:
+                logger.exception("[SIM] %s tick failed; dropping feed", type(feed).__name__)
+                feed.stop()
+                heapq.heappop(heap)
+                continue
+
+            heapq.heapreplace(heap, (deadline + interval, i))
+
+        for feed in feeds:
+            flush = getattr(feed, "flush", None)
+            if flush is not None:
+                try:
+                    await flush()
+                except Exception:
+                    logger.exception("[SIM] %s flush failed", type(feed).__name__)
@@ -1,8 +1,11 @@
 import asyncio
-from typing import Callable, Dict, Any, List
+import logging
+from asyncio import iscoroutine as _iscoro
+from typing import Callable, Dict, Any, List, Optional
 
 from bot_0dte.chain.chain_freshness_v2 import ChainFreshnessV2
 from bot_0dte.contracts.massive_contract_engine import MassiveContractEngine
+from bot_0dte.sim.synthetic_nbbo_feed import NBBORow
 
 
 class _DummyWS:
@@ -18,6 +21,9 @@ class _DummyWS:
         return
 
 
+logger = logging.getLogger(__name__)
+
+
 class SyntheticMux:
     """
     SyntheticMux v3.4 — EXACT MassiveMux semantics for simulation.
@@ -28,10 +34,18 @@ class SyntheticMux:
         • connect(symbols, expiry_map)
         • contract_engines[symbol]
         • freshness[symbol] (ChainFreshnessV2)
-        • push_option_batch(batch) — PRO-style batch NBBO
+        • push_option_batch(batch) — PRO-style batch NBBO (queued)
+        • push_option_batches(batches) — several ticks' batches at once
+        • push_option(row) — single PRO-style NBBO row
+        • push_option_chain(rows) — one tick of per-option rows
         • Emits PURE OCC for aggregator (critical)
+
+    Option batches go through a bounded queue drained by one consumer
+    task, so feeds only block when OPTION_QUEUE_MAX batches are pending.
     """
 
+    OPTION_QUEUE_MAX = 4
+
     def __init__(self):
         self._underlying_handlers: List[Callable] = []
         self._option_handlers: List[Callable] = []
@@ -47,6 +61,10 @@ class SyntheticMux:
 
         self._ws = _DummyWS()  # Provided to MassiveContractEngine
 
+        # Feed → mux option pipeline
+        self._option_q: asyncio.Queue = asyncio.Queue(self.OPTION_QUEUE_MAX)
+        self._option_consumer: Optional[asyncio.Task] = None
+
     # ------------------------------------------------------------------
     def on_underlying(self, cb: Callable):
         self._underlying_handlers.append(cb)
@@ -87,16 +105,59 @@ class SyntheticMux:
             await eng.on_underlying(event)
 
         # Fanout to handlers
+        create_task = self.loop.create_task
         for cb in list(self._underlying_handlers):
             out = cb(event)
-            if asyncio.iscoroutine(out):
-                self.loop.create_task(out)
+            if _iscoro(out):
+                create_task(out)
+
+    # ------------------------------------------------------------------
+    async def push_option_batch(self, batch: List[NBBORow]):
+        """
+        Enqueue a PRO-style batch for the option consumer.
+
+        Returns immediately unless the queue is full (backpressure).
+        """
+        if not batch:
+            return
+
+        if self._option_consumer is None or self._option_consumer.done():
+            self._option_consumer = self.loop.create_task(self._consume_options())
+
+        await self._option_q.put(batch)
+
+    # ------------------------------------------------------------------
+    async def push_option_batches(self, batches: List[List[NBBORow]]):
+        """
+        Enqueue several batches (oldest first) in one call.
+
+        Lets a feed hand over N ticks per await instead of one.
+        """
+        for batch in batches:
+            await self.push_option_batch(batch)
+
+    # ------------------------------------------------------------------
+    async def _consume_options(self):
+        """Drain all pending batches per wakeup and dispatch them in order."""
+        q = self._option_q
+        while True:
+            batches = [await q.get()]
+            while not q.empty():
+                batches.append(q.get_nowait())
+
+            for batch in batches:
+                try:
+                    await self._dispatch_option_batch(batch)
+                except Exception:
+                    logger.exception("[SyntheticMux] Option batch dispatch failed")
+                finally:
+                    q.task_done()
 
     # ------------------------------------------------------------------
-    async def push_option_batch(self, batch: List[Dict[str, Any]]):
+    async def _dispatch_option_batch(self, batch: List[NBBORow]):
         """
-        Handles PRO-style batches:
-            { "sym": "O:SPY20250117C00400000", "b": 1.23, "a": 1.25, "ts": ... }
+        Handles PRO-style batches of NBBORow:
+            NBBORow(sym="O:SPY20250117C00400000", b=1.23, a=1.25, ts=...)
 
         MUST:
             • hydrate ChainFreshnessV2 heartbeat/frame
@@ -107,7 +168,7 @@ class SyntheticMux:
         if not batch:
             return
 
-        occ_prefixed = batch[0].get("sym")
+        occ_prefixed = batch[0].sym
         if not occ_prefixed:
             return
 
@@ -128,10 +189,14 @@ class SyntheticMux:
         if fr:
             fr.update_heartbeat()
 
+        handlers = list(self._option_handlers)
+        create_task = self.loop.create_task
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Unroll batch
         for row in batch:
 
-            occ_prefixed = row["sym"]
+            occ_prefixed = row.sym
 
             try:
                 pure = occ_prefixed.split(":")[1]
@@ -155,24 +220,54 @@ class SyntheticMux:
                 "contract": pure,             # PURE OCC
                 "right": right,
                 "strike": float(strike),
-                "bid": row["b"],
-                "ask": row["a"],
-                "premium": (row["b"] + row["a"]) / 2,
-                "_recv_ts": row["ts"],
+                "bid": row.b,
+                "ask": row.a,
+                "premium": (row.b + row.a) / 2,
+                "_recv_ts": row.ts,
             }
 
+            # per_option rows carry greeks — forward them when present
+            if row.delta is not None:
+                expanded["delta"] = row.delta
+                expanded["gamma"] = row.gamma
+
             if fr:
                 fr.update_frame()
 
-            # Debug NBBO printout so you SEE it flow
-            print("EXPANDED NBBO:", expanded)
+            # Debug NBBO trace (enable DEBUG on this logger to SEE it flow)
+            if debug:
+                logger.debug("EXPANDED NBBO: %s", expanded)
 
             # Fanout to orchestrator
-            for cb in list(self._option_handlers):
+            for cb in handlers:
                 out = cb(expanded)
-                if asyncio.iscoroutine(out):
-                    self.loop.create_task(out)
+                if _iscoro(out):
+                    create_task(out)
+
+    # ------------------------------------------------------------------
+    async def push_option(self, row: NBBORow):
+        """Single-row variant of push_option_batch()."""
+        await self.push_option_batch([row])
+
+    # ------------------------------------------------------------------
+    async def push_option_chain(self, rows: List[NBBORow]):
+        """
+        One tick of per-option rows (delta/gamma populated) in one await.
+
+        Rows of a tick share an underlying, so they dispatch as a single
+        batch: one heartbeat, one frame update per row.
+        """
+        await self.push_option_batch(rows)
 
     # ------------------------------------------------------------------
     async def close(self):
-        pass
+        """Dispatch whatever is still queued, then stop the option consumer."""
+        consumer = self._option_consumer
+        if consumer is None:
+            return
+
+        if not consumer.done():
+            await self._option_q.join()
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+        self._option_consumer = None
@@ -1,25 +1,55 @@
 import asyncio
 import random
 import time
-from typing import Dict, Any
+from math import fabs
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple
+
+from bot_0dte.sim._pricing_kernels import greeks_chain, price_chain, update_flow_iv
+
+
+# Population ranges for per-tick volume / open-interest draws
+_VOL_RANGE = range(5, 251)       # realistic intraday volume
+_OI_RANGE = range(500, 5001)     # typical SPY OI levels
+
+
+@dataclass(slots=True)
+class NBBORow:
+    """
+    One PRO-format NBBO frame.
+
+    Slotted so each of the ~125 rows/sec is a fixed-layout object rather
+    than a 7-key dict. Quotes are cent-rounded at construction, like the
+    real NBBO.
+    """
+    sym: str            # OCC code (O:SPY20250117C00400000)
+    b: float
+    a: float
+    iv: float
+    vol: int
+    oi: int
+    premium: float      # orchestrator uses premium
+    ts: float
+    delta: Optional[float] = None   # per_option mode only
+    gamma: Optional[float] = None   # per_option mode only
 
 
 class SyntheticNBBOFeed:
     """
     PRO-Format Synthetic NBBO Generator (A2-M Compatible)
 
-    Generates PRO-format NBBO frames matching WSAdapterPRO:
+    Generates PRO-format NBBO frames (NBBORow) matching WSAdapterPRO:
 
-        {
-            "sym": "O:SPY20250117C00400000",
-            "b": 1.23,
-            "a": 1.25,
-            "ts": 1737052200.1234
-        }
+        NBBORow(sym="O:SPY20250117C00400000", b=1.23, a=1.25,
+                ts=1737052200.1234, ...)
 
-    These are sent as *batches* via:
+    emit_mode selects delivery:
 
-        await mux.push_option_batch(batch)
+        "batch"       → await mux.push_option_batches(batches)   (default)
+                        every FLUSH_TICKS ticks
+        "per_option"  → await mux.push_option_chain(rows) per tick,
+                        rows additionally carry "delta" / "gamma"
 
     SyntheticMux v3.2 then:
         ✓ hydrates ChainFreshnessV2
@@ -27,21 +57,74 @@ class SyntheticNBBOFeed:
         ✓ forwards per-option NBBO rows to orchestrator
     """
 
-    def __init__(self, mux, symbol: str, expiry: str, underlying, strike_inc=1):
+    OCC_TABLE_SPAN = 20
+    TICK_INTERVAL_S = 0.08
+    FLUSH_TICKS = 4     # batch mode: ticks accumulated per mux hand-off
+
+    def __init__(
+        self,
+        mux,
+        symbol: str,
+        expiry: str,
+        underlying,
+        strike_inc=1,
+        seed: Optional[int] = None,
+        emit_mode: Literal["batch", "per_option"] = "batch",
+    ):
+        if emit_mode not in ("batch", "per_option"):
+            raise ValueError(f"Unknown emit_mode: {emit_mode}")
+
         self.mux = mux               # SyntheticMux v3.2
         self.symbol = symbol
         self.expiry = expiry
         self.underlying = underlying
         self.strike_inc = strike_inc
+        self.emit_mode = emit_mode
 
         self._running = False
         self._last_under_price = underlying.price
 
+        # Private RNG per feed (seedable, no shared module state)
+        self._rng = random.Random(seed)
+        self._rand = self._rng.random
+        self._choices = self._rng.choices
+
         # Synthetic microstructure state
         self.iv_level = 0.22
-        self.flow_bias = 0  # +1 = call heavy, -1 = put heavy
+        self.flow_bias = 0.0  # +1 = call heavy, -1 = put heavy
+
+        # OCC code table + per-ATM strike grid columns (rebuilt only when ATM moves)
+        self._occ_table: Dict[Tuple[int, str], str] = {}
+        self._strikes = array("d")
+        self._is_call = array("b")
+        self._occs: Tuple[str, ...] = ()
+        self._last_atm = None
+
+        # Pre-seed OCC codes for ±OCC_TABLE_SPAN strikes around the start price
+        atm0 = round(underlying.price)
+        for i in range(-self.OCC_TABLE_SPAN, self.OCC_TABLE_SPAN + 1):
+            for right in ("C", "P"):
+                self._occ(atm0 + i * strike_inc, right)
+
+        # Kernel output buffers (ATM ±2 × C/P = 10 contracts)
+        self._mid_buf = array("d", [0.0] * 10)
+        self._half_buf = array("d", [0.0] * 10)
+        self._iv_buf = array("d", [0.0] * 10)
+        self._delta_buf = array("d", [0.0] * 10)
+        self._gamma_buf = array("d", [0.0] * 10)
+
+        # Batch mode: ticks not yet handed to the mux
+        self._pending: List[List[NBBORow]] = []
 
     # -----------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def arm(self):
+        """Mark the feed live; start() and SyntheticFeedDriver call this."""
+        self._running = True
+
     def stop(self):
         self._running = False
 
@@ -50,100 +133,139 @@ class SyntheticNBBOFeed:
         """
         Main synthetic NBBO loop — emits PRO-format NBBO batches
         every ~80ms, matching WSAdapterPRO timing.
+
+        Standalone loop; under SyntheticFeedDriver the driver calls
+        tick_once() directly instead.
         """
-        self._running = True
+        self.arm()
+
+        # Deadline-based cadence: compute time does not accumulate as drift
+        loop = asyncio.get_running_loop()
+        next_t = loop.time()
 
         while self._running:
+            next_t += await self.tick_once()
+            await asyncio.sleep(max(0.0, next_t - loop.time()))
+
+        await self.flush()
+
+    # -----------------------------------------------------------
+    async def flush(self):
+        """Push any batch-mode ticks still held back (e.g. on stop)."""
+        pending = self._pending
+        if pending:
+            self._pending = []
+            await self.mux.push_option_batches(pending)
+
+    # -----------------------------------------------------------
+    async def tick_once(self) -> float:
+        """Emit one NBBO cycle; returns seconds until the next one."""
+        rand = self._rand
+        mids = self._mid_buf
+        halves = self._half_buf
+        ivs = self._iv_buf
+
+        u = self.underlying.price
+        dt = max(0.01, fabs(u - self._last_under_price))
+        self._last_under_price = u
 
-            u = self.underlying.price
-            dt = max(0.01, abs(u - self._last_under_price))
-            self._last_under_price = u
-
-            # ---------------------------------------------------
-            # FLOW MODEL — creates call/put imbalance
-            # ---------------------------------------------------
-            if dt > 0.20:          # breakout
-                self.flow_bias += random.uniform(0.3, 0.8)
-            elif dt < 0.05:        # chop → mean revert
-                self.flow_bias *= 0.90
-            else:                  # weak trend
-                self.flow_bias += random.uniform(-0.1, 0.1)
-
-            self.flow_bias = max(-3, min(3, self.flow_bias))
-
-            # ---------------------------------------------------
-            # IV MODEL — expands on volatility
-            # ---------------------------------------------------
-            if dt > 0.15:
-                self.iv_level += random.uniform(0.01, 0.03)
-            else:
-                self.iv_level -= random.uniform(0.005, 0.015)
-
-            self.iv_level = max(0.12, min(0.45, self.iv_level))
-
-            # ---------------------------------------------------
-            # BUILD BATCH — ATM ±2 strikes each cycle
-            # ---------------------------------------------------
-            atm = round(u)
-            strikes = [
-                atm - 2 * self.strike_inc,
-                atm - 1 * self.strike_inc,
-                atm,
-                atm + 1 * self.strike_inc,
-                atm + 2 * self.strike_inc,
-            ]
-
-            batch = []
-
-            for strike in strikes:
-                for right in ["C", "P"]:
-
-                    mid = self._calc_midprice(u, strike, right)
-                    bid, ask = self._apply_spread(mid, dt)
-
-                    # PRO-style NBBO frame (A2-M compliant)
-                    mid = (bid + ask) / 2
-
-                    batch.append({
-                        "sym": self._occ(strike, right),  # OCC code (O:SPY20250117C00400000)
-                        "b": round(bid, 2),
-                        "a": round(ask, 2),
-                        "iv": round(self.iv_level + random.uniform(-0.02, 0.02), 4),
-                        "vol": random.randint(5, 250),         # realistic intraday volume
-                        "oi": random.randint(500, 5000),       # typical SPY OI levels
-                        "premium": round(mid, 3),              # orchestrator uses premium
-                        "ts": time.time(),
-                    })
-
-            # ---------------------------------------------------
-            # SEND BATCH → SyntheticMux → Orchestrator
-            # ---------------------------------------------------
-            await self.mux.push_option_batch(batch)
-
-            await asyncio.sleep(0.08)
+        # ---------------------------------------------------
+        # FLOW MODEL — creates call/put imbalance
+        # IV MODEL   — expands on volatility
+        # ---------------------------------------------------
+        self.flow_bias, self.iv_level = update_flow_iv(
+            self.flow_bias, self.iv_level, dt, rand(), rand(), rand()
+        )
+        iv_level = self.iv_level
+
+        # ---------------------------------------------------
+        # BUILD BATCH — ATM ±2 strikes each cycle
+        # ---------------------------------------------------
+        atm = round(u)
+        if atm != self._last_atm:
+            self._rebuild_grid(atm)
+
+        # Per-contract pricing as parallel (SoA) columns
+        n = len(self._strikes)
+        sp_lo, sp_hi = self._spread_range(dt)
+        draws = array("d", [rand() for _ in range(3 * n)])
+        price_chain(
+            u, iv_level, sp_lo, sp_hi,
+            self._strikes, self._is_call, draws,
+            mids, halves, ivs,
+        )
+        vols = self._choices(_VOL_RANGE, k=n)
+        ois = self._choices(_OI_RANGE, k=n)
+
+        ts = time.time()
+        batch = []
+
+        # PRO-style NBBO frames (A2-M compliant); spread is symmetric, so
+        # the kernel mid is already the premium
+        for occ, mid, half, iv, vol, oi in zip(self._occs, mids, halves, ivs, vols, ois):
+            batch.append(NBBORow(
+                occ,
+                round(mid - half, 2),
+                round(mid + half, 2),
+                round(iv, 4),
+                vol,
+                oi,
+                round(mid, 3),
+                ts,
+            ))
+
+        # ---------------------------------------------------
+        # SEND → SyntheticMux → Orchestrator
+        # ---------------------------------------------------
+        if self.emit_mode == "per_option":
+            deltas = self._delta_buf
+            gammas = self._gamma_buf
+            greeks_chain(u, self._strikes, self._is_call, deltas, gammas)
+            for row, delta, gamma in zip(batch, deltas, gammas):
+                row.delta = round(delta, 3)
+                row.gamma = round(gamma, 4)
+            await self.mux.push_option_chain(batch)
+        else:
+            self._pending.append(batch)
+            if len(self._pending) >= self.FLUSH_TICKS:
+                await self.flush()
+
+        return self.TICK_INTERVAL_S
 
     # -----------------------------------------------------------
-    def _calc_midprice(self, u, strike, right):
-        intrinsic = max(0, u - strike) if right == "C" else max(0, strike - u)
-        extrinsic = self.iv_level * (1 + random.uniform(-0.15, 0.15))
-        return max(0.05, intrinsic + extrinsic)
+    def _rebuild_grid(self, atm):
+        """Rebuild the ATM ±2 strike/right/OCC columns for a new ATM."""
+        inc = self.strike_inc
+        grid = [
+            (strike, right)
+            for strike in (atm - 2 * inc, atm - inc, atm, atm + inc, atm + 2 * inc)
+            for right in ("C", "P")
+        ]
+        self._strikes = array("d", [k for k, _ in grid])
+        self._is_call = array("b", [r == "C" for _, r in grid])
+        self._occs = tuple(self._occ(k, r) for k, r in grid)
+        self._last_atm = atm
 
     # -----------------------------------------------------------
-    def _apply_spread(self, mid, dt):
+    @staticmethod
+    def _spread_range(dt):
         """
         Spread tightens during trend, widens during chop — like real markets.
         """
         if dt > 0.15:
-            sp = random.uniform(0.01, 0.04)
-        elif dt < 0.05:
-            sp = random.uniform(0.05, 0.12)
-        else:
-            sp = random.uniform(0.02, 0.08)
-
-        return mid - sp / 2, mid + sp / 2
+            return 0.01, 0.04
+        if dt < 0.05:
+            return 0.05, 0.12
+        return 0.02, 0.08
 
     # -----------------------------------------------------------
     def _occ(self, strike, right):
+        """OCC code lookup; strikes outside the pre-seeded table are built once."""
         s = int(strike * 1000)
-        # PRO format uses "O:" prefix just like WSAdapterPRO
-        return f"O:{self.symbol}{self.expiry}{right}{s:08d}"
+        key = (s, right)
+        occ = self._occ_table.get(key)
+        if occ is None:
+            # PRO format uses "O:" prefix just like WSAdapterPRO
+            occ = f"O:{self.symbol}{self.expiry}{right}{s:08d}"
+            self._occ_table[key] = occ
+        return occ
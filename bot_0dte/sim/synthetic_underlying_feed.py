@@ -31,6 +31,7 @@ class SyntheticUnderlyingFeed:
         drift: float = 0.03,
         volatility: float = 0.8,
         tick_interval_ms: tuple = (20, 80),
+        seed: Optional[int] = None,
     ):
         self.mux = mux
         self.symbol = symbol
@@ -43,42 +44,71 @@ class SyntheticUnderlyingFeed:
 
         self._running = False
 
-    async def start(self):
-        """Begin streaming synthetic underlying ticks."""
+        # Private RNG per feed (seedable, no shared module state)
+        self._rng = random.Random(seed)
+        self._gauss = self._rng.gauss
+        self._randint = self._rng.randint
+        self._last_ts: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def arm(self):
+        """Mark the feed live; start() and SyntheticFeedDriver call this."""
         self._running = True
-        last_ts = time.time()
+
+    async def start(self):
+        """
+        Begin streaming synthetic underlying ticks.
+
+        Standalone loop; under SyntheticFeedDriver the driver calls
+        tick_once() directly instead.
+        """
+        self.arm()
+
+        # Deadline-based cadence: compute time does not accumulate as drift
+        loop = asyncio.get_running_loop()
+        next_t = loop.time()
 
         while self._running:
-            now = time.time()
-            dt = now - last_ts
-            last_ts = now
-
-            # drift + noise
-            noise = random.gauss(0, self.sigma) * math.sqrt(dt)
-            self.price += self.drift * dt + noise
-
-            # synthetic bid/ask microstructure
-            spread = max(0.01, random.gauss(0.02, 0.005))
-            bid = self.price - spread / 2
-            ask = self.price + spread / 2
-
-            # volume estimate for VWAP weighting
-            vol = max(1, int(abs(random.gauss(20, 5))))
-
-            event = {
-                "symbol": self.symbol,
-                "price": round(self.price, 3),
-                "bid": round(bid, 3),
-                "ask": round(ask, 3),
-                "volume": vol,
-                "_ts": time.time(),
-            }
-
-            await self.mux.push_underlying(event)
-
-            # random latency jitter (simulate IBKR)
-            ms = random.randint(self.tick_lo, self.tick_hi)
-            await asyncio.sleep(ms / 1000.0)
+            next_t += await self.tick_once()
+            await asyncio.sleep(max(0.0, next_t - loop.time()))
+
+    async def tick_once(self) -> float:
+        """Emit one underlying tick; returns seconds until the next one."""
+        now = time.time()
+        last_ts = self._last_ts
+        dt = now - last_ts if last_ts is not None else 0.0
+        self._last_ts = now
+
+        gauss = self._gauss
+
+        # drift + noise
+        noise = gauss(0, self.sigma) * math.sqrt(dt)
+        self.price += self.drift * dt + noise
+
+        # synthetic bid/ask microstructure
+        spread = max(0.01, gauss(0.02, 0.005))
+        bid = self.price - spread / 2
+        ask = self.price + spread / 2
+
+        # volume estimate for VWAP weighting
+        vol = max(1, int(math.fabs(gauss(20, 5))))
+
+        event = {
+            "symbol": self.symbol,
+            "price": round(self.price, 3),
+            "bid": round(bid, 3),
+            "ask": round(ask, 3),
+            "volume": vol,
+            "_ts": now,
+        }
+
+        await self.mux.push_underlying(event)
+
+        # random latency jitter (simulate IBKR)
+        return self._randint(self.tick_lo, self.tick_hi) / 1000.0
 
     def stop(self):
         self._running = False
@@ -1,13 +1,15 @@
 """
 Strategy Layer - Signals + trade logic.
 """
-from .morning_breakout import MorningBreakout
-from .latency_precheck import LatencyPrecheck
+from .morning_breakout import BreakoutSnap, MorningBreakout
+from .latency_precheck import LatencyPrecheck, LatencyTick
 from .strike_selector import StrikeSelector
 
 __all__ = [
+    "BreakoutSnap",
     "MorningBreakout",
     "LatencyPrecheck",
+    "LatencyTick",
     "PrecheckResult",
     "StrikeSelector",
 ]
@@ -0,0 +1,94 @@
+"""
+MorningBreakout numeric core.
+
+Scalar-in / code-out so numba (when installed, see bot_0dte.infra.jit)
+runs qualify()'s branch cascade without touching dicts or strings;
+plain Python otherwise.
+
+Encoding:
+    • missing inputs are NaN (NaN upvol / flow → microstructure passes,
+      NaN iv_change / skew → no vol support or veto)
+    • signal codes index morning_breakout's signal table (0 = none);
+      each vol-neutral code + 1 is its vol-supported variant
+
+The thresholds live here (numba freezes module globals into the
+compiled kernel); MorningBreakout re-exposes them. Signature is pinned
+so numba compiles once, eagerly, at import. No fastmath: NaN is a real
+input.
+"""
+
+import math
+
+from bot_0dte.infra.jit import njit
+
+# Microstructure thresholds (optional enhancements)
+MIN_UPVOL = 60.0
+MIN_FLOW_CALL = 1.20
+MAX_FLOW_PUT = 0.80
+
+# Slope thresholds to avoid random noise
+MIN_SLOPE_UP = 0.00
+MIN_SLOPE_DN = 0.00
+
+# Morning-only window
+MORNING_LIMIT_SEC = 5400.0  # first 90 minutes (9:30 - 11:00 AM)
+
+# Signal codes
+SIG_NONE = 0
+EARLY_CALL = 1      # + 1 = A+ Early / SUPPORT
+EARLY_PUT = 3       # + 1 = A+ Early / SUPPORT
+RECLAIM_CALL = 5    # + 1 = CONFIRM
+REJECT_PUT = 7      # + 1 = CONFIRM
+
+
+@njit(
+    "int64(float64, float64, float64, float64, float64,"
+    " float64, float64, float64, float64)",
+    cache=True,
+)
+def qualify_core(price, vwap, dev, slope, secs, upvol, flow, ivc, skew):
+    """
+    Early-entry / standard-mode breakout decision for one snapshot.
+
+    Returns:
+        signal code (SIG_NONE or the matching signal)
+    """
+    # MORNING WINDOW first — rejects every snap after 11:00 (NaN → outside)
+    if not secs <= MORNING_LIMIT_SEC:
+        return SIG_NONE
+
+    # REQUIRED
+    if math.isnan(price) or math.isnan(vwap):
+        return SIG_NONE
+
+    # LAYER 1 — STRUCTURE (pre-reclaim / pre-reject)
+    pre_call = price < vwap and slope > MIN_SLOPE_UP
+    pre_put = price > vwap and slope < MIN_SLOPE_DN
+
+    # LAYER 2 — MICROSTRUCTURE (unavailable → passes)
+    if math.isnan(upvol) or math.isnan(flow):
+        micro_call = True
+        micro_put = True
+    else:
+        micro_call = upvol >= MIN_UPVOL and flow >= MIN_FLOW_CALL
+        micro_put = upvol >= MIN_UPVOL and flow <= MAX_FLOW_PUT
+
+    # LAYER 3 — VOL SURFACE (booster or veto; NaN → neither)
+    vol_support = ivc > 0.0 and skew > 0.0
+    vol_against = ivc < 0.0 and skew < 0.0
+    boost = 1 if vol_support else 0
+
+    # EARLY ENTRY (vol-against falls through to standard mode)
+    if not vol_against:
+        if pre_call and micro_call:
+            return EARLY_CALL + boost
+        if pre_put and micro_put:
+            return EARLY_PUT + boost
+
+    # STANDARD MODE — VWAP reclaim / rejection
+    if dev > 0.0 and slope > MIN_SLOPE_UP:
+        return RECLAIM_CALL + boost
+    if dev < 0.0 and slope < MIN_SLOPE_DN:
+        return REJECT_PUT + boost
+
+    return SIG_NONE
@@ -0,0 +1,151 @@
+"""
+ContinuationEngine numeric core.
+
+Scalar-in / tuple-out so numba (when installed, see bot_0dte.infra.jit)
+keeps the whole tick in registers; plain Python otherwise.
+
+Encoding:
+    • pullback_high / pullback_low use NaN for "not initialised"
+    • signal codes: 0 = none, 1 = CONTINUATION_UP, 2 = CONTINUATION_DN
+
+Signatures are pinned all-float so numba compiles once, eagerly, and
+int timestamps / cooldowns are widened at the call instead of triggering
+a second specialisation. No fastmath: it assumes NaN never occurs, which
+would break the sentinels.
+"""
+
+import math
+from array import array
+
+from bot_0dte.infra.jit import njit
+
+SIG_NONE = 0
+SIG_UP = 1
+SIG_DN = 2
+
+
+# _leg outcomes
+_PASS = 0      # trend structure lost — fall through to the next leg
+_HOLD = 1      # pullback initialised / in progress — no signal this tick
+_FIRE = 2      # local extreme broken — signal
+
+
+@njit("Tuple((int64, float64))(float64, float64, float64, float64, float64)", cache=True)
+def _leg(sign, price, vwap, ma, ext):
+    """
+    One trend direction, mirrored by sign.
+
+    sign = +1.0 → up leg,   ext = pullback high
+    sign = -1.0 → down leg, ext = pullback low
+
+    Returns:
+        (outcome, ext)
+    """
+    if sign * (price - vwap) >= 0.0 and sign * (ma - vwap) >= 0.0:
+        if sign * (price - ext) > 0.0:         # breakout / breakdown (NaN → False)
+            return _FIRE, ext
+        if math.isnan(ext):                    # initialise pullback extreme
+            return _HOLD, price
+        return _HOLD, ext                      # pullback phase / retest
+    return _PASS, math.nan                     # VWAP/MA failed — reset
+
+
+@njit(
+    "Tuple((int64, float64, float64, float64))"
+    "(float64, float64, float64, float64, boolean, boolean,"
+    " float64, float64, float64, float64)",
+    cache=True,
+)
+def tick_core(price, vwap, ma, ts, up, dn, ph, pl, next_ok, cooldown):
+    """
+    One continuation tick.
+
+    next_ok is the first timestamp at which a new signal may fire
+    (last signal ts + cooldown), so the hot cooldown check is one compare.
+
+    Returns:
+        (signal_code, pullback_high, pullback_low, next_allowed_ts)
+    """
+    # GLOBAL COOLDOWN — prevents double entries
+    if ts < next_ok:
+        return SIG_NONE, ph, pl, next_ok
+
+    # CONTINUATION UP
+    if up:
+        outcome, ph = _leg(1.0, price, vwap, ma, ph)
+        if outcome == _FIRE:
+            return SIG_UP, math.nan, math.nan, ts + cooldown
+        if outcome == _HOLD:
+            return SIG_NONE, ph, pl, next_ok
+
+    # CONTINUATION DOWN
+    if dn:
+        outcome, pl = _leg(-1.0, price, vwap, ma, pl)
+        if outcome == _FIRE:
+            return SIG_DN, math.nan, math.nan, ts + cooldown
+        if outcome == _HOLD:
+            return SIG_NONE, ph, pl, next_ok
+
+    return SIG_NONE, ph, pl, next_ok
+
+
+@njit(
+    "Tuple((int64, float64, float64))"
+    "(float64, float64, float64, float64, float64, float64, float64, float64)",
+    cache=True,
+)
+def tick_leg(sign, price, vwap, ma, ts, ext, next_ok, cooldown):
+    """
+    One continuation tick for a single known trend direction.
+
+    Specialisation of tick_core for when exactly one trend flag is set
+    (the only states update_trend_flags produces): the opposite leg and
+    its extreme are never touched.
+
+    Returns:
+        (signal_code, pullback_extreme, next_allowed_ts)
+    """
+    if ts < next_ok:
+        return SIG_NONE, ext, next_ok
+
+    outcome, ext = _leg(sign, price, vwap, ma, ext)
+    if outcome == _FIRE:
+        return (SIG_UP if sign > 0.0 else SIG_DN), math.nan, ts + cooldown
+    return SIG_NONE, ext, next_ok
+
+
+@njit(cache=True)
+def tick_book(idx, price, vwap, ma, ts, up, dn, ph, pl, next_ok, last_sig, cooldown, codes_out):
+    """
+    Batch of ticks against ContinuationBook columns.
+
+    Tick j applies to row idx[j]; rows are updated in place and the
+    signal code for tick j is written to codes_out[j]. Ticks are applied
+    in order, so several ticks for the same row behave like sequential
+    tick_core calls.
+    """
+    for j in range(len(idx)):
+        i = idx[j]
+        code, ph[i], pl[i], next_ok[i] = tick_core(
+            price[j], vwap[j], ma[j], ts[j],
+            up[i] != 0, dn[i] != 0,
+            ph[i], pl[i], next_ok[i], cooldown,
+        )
+        if code != SIG_NONE:
+            last_sig[i] = ts[j]
+        codes_out[j] = code
+
+
+def _warmup():
+    """Compile tick_book at import, on ContinuationBook's buffer types."""
+    tick_book(
+        array("l", [0]),
+        array("d", [1.0]), array("d", [1.0]), array("d", [1.0]), array("d", [0.0]),
+        array("b", [0]), array("b", [0]),
+        array("d", [math.nan]), array("d", [math.nan]),
+        array("d", [1.0]), array("d", [0.0]),
+        1.0, array("b", [0]),
+    )
+
+
+_warmup()
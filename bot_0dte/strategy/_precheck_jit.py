@@ -0,0 +1,261 @@
+"""
+EliteLatencyPrecheck / LatencyPrecheck numeric core.
+
+Scalar-in / code-out so numba (when installed, see bot_0dte.infra.jit)
+runs the quote gates without touching dicts or strings; plain Python
+otherwise.
+
+Encoding:
+    • missing numeric inputs are NaN (a NaN size / delta / gamma skips
+      its guard, exactly like None did)
+    • bias_sign: +1 = CALL, -1 = PUT, 0 = anything else
+    • result codes index REASONS (0 = passed the numeric gates)
+
+The thresholds live here (numba freezes module globals into the
+compiled kernel); elite_latency_precheck re-exports them. LatencyPrecheck
+shares the same quote arithmetic through measure_core instead of
+keeping its own copy. Signatures are pinned so numba compiles once,
+eagerly, at import. No fastmath: NaN is a real input.
+"""
+
+import math
+from array import array
+
+from bot_0dte.infra.jit import njit
+
+MAX_SPREAD_A = 0.20
+MAX_SPREAD_A_PLUS = 0.30
+
+MAX_SLIPPAGE_A = 0.12
+MAX_SLIPPAGE_A_PLUS = 0.18
+
+MAX_MID_DRIFT = 0.10
+MIN_SIZE = 5
+
+# v3.1 used 2.0 seconds — A2-M uses ms implicitly
+MAX_CHAIN_AGE = 2.0  # sec fallback for old data
+
+# validate_core tests reversal as bias_sign * slope < REVERSAL_CALL,
+# which is only the PUT rule while the two stay mirrored — so PUT's
+# threshold is derived, never set independently
+REVERSAL_CALL = -0.01
+REVERSAL_PUT = -REVERSAL_CALL
+
+MIN_GAMMA = 0.002            # dead-option protection
+MAX_DELTA_OFF_TARGET = 0.18  # delta too misaligned becomes toxic
+
+# Result codes
+OK = 0
+MISSING_PRICES = 1
+INVALID_QUOTES = 2
+LOCKED_MARKET = 3
+STALE_NBBO = 4
+WIDE_SPREAD = 5
+MID_DRIFT = 6
+SLIPPAGE_RISK = 7
+PREMIUM_CEILING = 8
+DELTA_MISALIGNED = 9
+LOW_GAMMA = 10
+MICRO_REVERSAL = 11
+THIN_LIQUIDITY = 12
+
+REASONS = (
+    None,
+    "missing_prices",
+    "invalid_quotes",
+    "locked_market",
+    "stale_nbbo",
+    "wide_spread",
+    "mid_drift",
+    "slippage_risk",
+    "premium_ceiling",
+    "delta_misaligned",
+    "low_gamma",
+    "micro_reversal",
+    "thin_liquidity",
+)
+
+# measure_batch error codes (index MEASURE_ERRORS; 0 = measured)
+MEASURE_MISSING_PRICES = 1
+MEASURE_ZERO_QUOTE = 2
+MEASURE_NON_POSITIVE_PRICE = 3
+
+MEASURE_ERRORS = (None, "missing_prices", "zero_bid_or_ask", "non_positive_price")
+
+
+@njit(
+    "int64(float64, float64, float64, float64, float64, float64, float64,"
+    " float64, float64, int64, boolean, float64)",
+    cache=True,
+)
+def validate_core(
+    price, bid, ask, bid_size, ask_size, slope, chain_age,
+    delta, gamma, bias_sign, a_plus, ceiling,
+):
+    """
+    Quote / convexity / reversal / liquidity gates, in v3.1 order.
+
+    CALL checks spread → mid drift → slippage; PUT (and any other bias)
+    checks slippage → spread → mid drift.
+
+    Returns:
+        result code (OK or the first failing gate)
+    """
+    # REQUIRED
+    if math.isnan(price) or math.isnan(bid) or math.isnan(ask):
+        return MISSING_PRICES
+    if bid <= 0.0 or ask <= 0.0:
+        return INVALID_QUOTES
+
+    # LOCKED / CROSSED
+    if bid >= ask:
+        return LOCKED_MARKET
+
+    # CHAIN AGE
+    if chain_age > MAX_CHAIN_AGE:
+        return STALE_NBBO
+
+    mid = (bid + ask) / 2
+    limit_side = ask if bias_sign == 1 else bid
+    inv_p = 1.0 / max(price, 0.01)
+
+    spread_pct = (ask - bid) * inv_p
+    max_spread = MAX_SPREAD_A_PLUS if a_plus else MAX_SPREAD_A
+
+    max_slippage = MAX_SLIPPAGE_A_PLUS if a_plus else MAX_SLIPPAGE_A
+    slippage = abs(limit_side - price) * inv_p
+
+    mid_drift = abs(mid - price) * inv_p
+
+    if bias_sign == 1:
+        if spread_pct > max_spread:
+            return WIDE_SPREAD
+        if mid_drift > MAX_MID_DRIFT:
+            return MID_DRIFT
+        if slippage > max_slippage:
+            return SLIPPAGE_RISK
+    else:
+        if slippage > max_slippage:
+            return SLIPPAGE_RISK
+        if spread_pct > max_spread:
+            return WIDE_SPREAD
+        if mid_drift > MAX_MID_DRIFT:
+            return MID_DRIFT
+
+    # PREMIUM CEILING
+    if mid > ceiling:
+        return PREMIUM_CEILING
+
+    # DELTA & GAMMA CONVEXITY GUARD (NaN → skipped)
+    # Target is ±0.30 by bias sign; no target for an unknown bias
+    if bias_sign != 0 and abs(delta - bias_sign * 0.30) > MAX_DELTA_OFF_TARGET:
+        return DELTA_MISALIGNED
+    if gamma < MIN_GAMMA:
+        return LOW_GAMMA
+
+    # REVERSAL — sign-mirrored: PUT's slope > REVERSAL_PUT is
+    # -slope < REVERSAL_CALL; bias_sign 0 never fires
+    if bias_sign * slope < REVERSAL_CALL:
+        return MICRO_REVERSAL
+
+    # LIQUIDITY
+    if bid_size < MIN_SIZE or ask_size < MIN_SIZE:
+        return THIN_LIQUIDITY
+
+    return OK
+
+
+@njit("Tuple((float64, float64, float64))(float64, float64, float64, int64)", cache=True)
+def measure_core(price, bid, ask, bias_sign):
+    """
+    LatencyPrecheck's observability metrics (no gates).
+
+    Spread is relative to mid; slippage is sign-mirrored (CALL
+    ask - price, anything else price - bid) relative to price.
+    Callers have already rejected missing / non-positive quotes and
+    prices, so both divisors are positive and need no floor.
+
+    Returns:
+        (spread_pct, slippage_pct, limit_price)
+    """
+    mid = (bid + ask) / 2
+    is_call = bias_sign == 1
+    limit_price = ask if is_call else bid
+    sign = 1.0 if is_call else -1.0
+    spread_pct = (ask - bid) / mid
+    slippage_pct = sign * (limit_price - price) / price
+    return spread_pct, slippage_pct, limit_price
+
+
+@njit(cache=True)
+def validate_batch(
+    price, bid, ask, bid_size, ask_size, slope, chain_age,
+    delta, gamma, bias_sign, a_plus, ceiling, codes_out, limit_out,
+):
+    """
+    validate_core over N rows (one per watched contract).
+
+    Row i reads element i of every input buffer (bias_sign / a_plus as
+    int8) and writes its result code to codes_out[i] and the limit
+    price (ask for CALL, bid otherwise) to limit_out[i].
+    """
+    for i in range(len(codes_out)):
+        codes_out[i] = validate_core(
+            price[i], bid[i], ask[i], bid_size[i], ask_size[i], slope[i],
+            chain_age[i], delta[i], gamma[i], bias_sign[i], a_plus[i] != 0,
+            ceiling[i],
+        )
+        limit_out[i] = ask[i] if bias_sign[i] == 1 else bid[i]
+
+
+@njit(cache=True)
+def measure_batch(price, bid, ask, bias_sign, spread_out, slippage_out, limit_out, errors_out):
+    """
+    LatencyPrecheck.measure over N rows.
+
+    Row i reads price[i] / bid[i] / ask[i] (NaN = missing) and
+    bias_sign[i] (+1 CALL, anything else PUT) and writes its metrics to
+    the *_out buffers and its error code to errors_out[i]. Rows that
+    measure() would reject get 0.0 spread / slippage and a NaN limit.
+    """
+    for i in range(len(errors_out)):
+        if math.isnan(price[i]) or math.isnan(bid[i]) or math.isnan(ask[i]):
+            code = MEASURE_MISSING_PRICES
+        elif bid[i] <= 0.0 or ask[i] <= 0.0:
+            code = MEASURE_ZERO_QUOTE
+        elif price[i] <= 0.0:
+            code = MEASURE_NON_POSITIVE_PRICE
+        else:
+            code = 0
+
+        errors_out[i] = code
+        if code:
+            spread_out[i] = 0.0
+            slippage_out[i] = 0.0
+            limit_out[i] = math.nan
+        else:
+            spread_out[i], slippage_out[i], limit_out[i] = measure_core(
+                price[i], bid[i], ask[i], bias_sign[i]
+            )
+
+
+def _warmup():
+    """
+    Compile the lazy batch kernels at import, on the buffer types
+    EliteLatencyPrecheck / LatencyPrecheck pass, so the first live batch
+    pays no JIT cost. The scalar kernels are already eager (pinned).
+    """
+    validate_batch(
+        array("d", [1.0]), array("d", [1.0]), array("d", [1.0]),
+        array("d", [1.0]), array("d", [1.0]), array("d", [1.0]),
+        array("d", [1.0]), array("d", [1.0]), array("d", [1.0]),
+        array("b", [1]), array("b", [0]), array("d", [1.0]),
+        array("b", [0]), array("d", [0.0]),
+    )
+    measure_batch(
+        array("d", [1.0]), array("d", [0.95]), array("d", [1.05]), array("b", [1]),
+        array("d", [0.0]), array("d", [0.0]), array("d", [0.0]), array("b", [0]),
+    )
+
+
+_warmup()
@@ -0,0 +1,77 @@
+"""
+EliteEntryEngine scoring core.
+
+Scalar-in / tuple-out so numba (when installed, see bot_0dte.infra.jit)
+compiles build_signal's arithmetic to native code; plain Python otherwise.
+
+Encoding:
+    • grade codes: 0 = B, 1 = A, 2 = A+ (number of grade thresholds met)
+    • is_reclaim: True for any non-TREND regime
+
+The scoring constants live here (numba freezes module globals into the
+compiled kernel); elite_entry re-exports them. Signature is pinned so
+numba compiles once, eagerly, at import — no first-call JIT latency.
+"""
+
+from array import array
+
+from bot_0dte.infra.jit import njit
+
+# Base scores by regime type
+BASE_SCORE_TREND = 60.0
+BASE_SCORE_RECLAIM = 70.0
+
+# VWAP energy boosts (observability scoring)
+BOOST_STRONG_SLOPE = 15.0  # abs(slope) > 0.05
+BOOST_HIGH_DEV = 10.0      # abs(dev) > 0.15
+
+# Grading thresholds
+GRADE_A_PLUS_THRESHOLD = 90.0
+GRADE_A_THRESHOLD = 70.0
+
+
+@njit("Tuple((float64, int64))(boolean, float64, float64)", cache=True)
+def score_kernel(is_reclaim, vwap_dev, vwap_dev_change):
+    """
+    Score and grade one approved entry.
+
+    Branchless: each boost is its weight × a 0/1 comparison, and the
+    grade code is the number of thresholds the score meets.
+
+    Returns:
+        (score, grade_code)
+    """
+    score = (
+        BASE_SCORE_TREND
+        + (BASE_SCORE_RECLAIM - BASE_SCORE_TREND) * (1.0 if is_reclaim else 0.0)   # 60 / 70
+        + BOOST_STRONG_SLOPE * (1.0 if abs(vwap_dev_change) > 0.05 else 0.0)       # +15
+        + BOOST_HIGH_DEV * (1.0 if abs(vwap_dev) > 0.15 else 0.0)                  # +10
+    )
+    code = (1 if score >= GRADE_A_THRESHOLD else 0) + (1 if score >= GRADE_A_PLUS_THRESHOLD else 0)
+    return score, code
+
+
+@njit(cache=True)
+def score_batch(is_reclaim, vwap_dev, vwap_dev_change, scores_out, codes_out):
+    """
+    score_kernel over N rows (replay / backtest).
+
+    Row i reads is_reclaim[i] (0/1), vwap_dev[i], vwap_dev_change[i] and
+    writes scores_out[i] / codes_out[i]. One compiled loop instead of N
+    interpreter calls.
+    """
+    for i in range(len(scores_out)):
+        scores_out[i], codes_out[i] = score_kernel(
+            is_reclaim[i] != 0, vwap_dev[i], vwap_dev_change[i]
+        )
+
+
+def _warmup():
+    """Compile score_batch at import, on build_signal_batch's buffer types."""
+    score_batch(
+        array("b", [1]), array("d", [0.0]), array("d", [0.0]),
+        array("d", [0.0]), array("b", [0]),
+    )
+
+
+_warmup()
@@ -17,24 +17,35 @@ REFACTOR NOTE:
             return
 """
 
-import time
+from array import array
 from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from math import nan as _NAN
+from typing import Dict, Optional, Sequence, TYPE_CHECKING
+
+from bot_0dte.strategy._continuation_jit import tick_book, tick_core, tick_leg
 
 if TYPE_CHECKING:
     from bot_0dte.strategy.session_mandate import SessionMandate
 
 
-@dataclass
+@dataclass(slots=True)
 class ContinuationState:
     in_trend_up: bool = False
     in_trend_dn: bool = False
 
-    pullback_low: float = None
-    pullback_high: float = None
+    # NaN = not initialised (NaN compares False, no None type checks)
+    pullback_low: float = _NAN
+    pullback_high: float = _NAN
+
+    last_reclaim_ts: float = 0.0
+    last_signal_ts: float = 0.0
+
+    # last_signal_ts + cooldown, maintained on signal fire
+    next_allowed_ts: float = 0.0
 
-    last_reclaim_ts: float = 0
-    last_signal_ts: float = 0
+
+# tick_core signal code → public signal name
+_SIGNAL_NAMES = (None, "CONTINUATION_UP", "CONTINUATION_DN")
 
 
 class ContinuationEngine:
@@ -62,10 +73,13 @@ class ContinuationEngine:
     """
 
     def __init__(self, lookback_sec=30, cooldown_sec=20):
-        self.state = ContinuationState()
+        self.state = ContinuationState(next_allowed_ts=float(cooldown_sec))
         self.lookback_sec = lookback_sec
         self.cooldown_sec = cooldown_sec
 
+        # Per-trend tick specialisation, re-selected by update_trend_flags()
+        self._tick_fn = self._on_tick_none
+
     # ------------------------------------------------------------------
     def update_trend_flags(self, mandate: "SessionMandate"):
         """
@@ -80,8 +94,8 @@ class ContinuationEngine:
             # No bias → reset both flags and pullback state
             if self.state.in_trend_up or self.state.in_trend_dn:
                 # Bias flip detected - reset pullback state
-                self.state.pullback_high = None
-                self.state.pullback_low = None
+                self.state.pullback_high = _NAN
+                self.state.pullback_low = _NAN
             self.state.in_trend_up = False
             self.state.in_trend_dn = False
         else:
@@ -90,12 +104,19 @@ class ContinuationEngine:
             
             # Detect bias flip and reset pullback state
             if new_trend_up != self.state.in_trend_up or new_trend_dn != self.state.in_trend_dn:
-                self.state.pullback_high = None
-                self.state.pullback_low = None
+                self.state.pullback_high = _NAN
+                self.state.pullback_low = _NAN
             
             self.state.in_trend_up = new_trend_up
             self.state.in_trend_dn = new_trend_dn
 
+        if self.state.in_trend_up:
+            self._tick_fn = self._on_tick_up
+        elif self.state.in_trend_dn:
+            self._tick_fn = self._on_tick_dn
+        else:
+            self._tick_fn = self._on_tick_none
+
     # ------------------------------------------------------------------
     def on_tick(
         self,
@@ -109,67 +130,133 @@ class ContinuationEngine:
         Called every NBBO/underlying update.
         
         PRECONDITION: If mandate is provided, mandate.allows_entry() == True
+
+        Dispatches to the tick path for the current trend (chosen once in
+        update_trend_flags), so only that direction's leg is evaluated;
+        the branch logic lives in _continuation_jit.tick_leg (numba when
+        available).
         
         Returns:
             "CONTINUATION_UP", "CONTINUATION_DN", or None
         """
+        return self._tick_fn(price, vwap, ma, ts)
 
+    # ------------------------------------------------------------------
+    def _on_tick_up(self, price, vwap, ma, ts):
         s = self.state
+        code, s.pullback_high, s.next_allowed_ts = tick_leg(
+            1.0, price, vwap, ma, ts,
+            s.pullback_high, s.next_allowed_ts, self.cooldown_sec,
+        )
+        if code:
+            s.last_signal_ts = ts
+            return "CONTINUATION_UP"
+        return None
 
-        # ------------------------------------------------------------
-        # GLOBAL COOLDOWN — prevents double entries
-        # ------------------------------------------------------------
-        if ts - s.last_signal_ts < self.cooldown_sec:
-            return None
+    def _on_tick_dn(self, price, vwap, ma, ts):
+        s = self.state
+        code, s.pullback_low, s.next_allowed_ts = tick_leg(
+            -1.0, price, vwap, ma, ts,
+            s.pullback_low, s.next_allowed_ts, self.cooldown_sec,
+        )
+        if code:
+            s.last_signal_ts = ts
+            return "CONTINUATION_DN"
+        return None
 
-        # ------------------------------------------------------------
-        # CONTINUATION UP
-        # ------------------------------------------------------------
-        if s.in_trend_up and price >= vwap and ma >= vwap:
-            
-            # Initialize pullback high
-            if s.pullback_high is None:
-                s.pullback_high = price
-                return None
-            
-            # Pullback phase (price below high)
-            if price < s.pullback_high:
-                return None
-            
-            # Breakout phase (price exceeds prior high)
-            if price > s.pullback_high:
-                s.last_signal_ts = ts
-                s.pullback_high = None
-                s.pullback_low = None
-                return "CONTINUATION_UP"
-        
-        elif s.in_trend_up:
-            # VWAP or MA condition failed - reset pullback
-            s.pullback_high = None
-
-        # ------------------------------------------------------------
-        # CONTINUATION DOWN
-        # ------------------------------------------------------------
-        if s.in_trend_dn and price <= vwap and ma <= vwap:
-            
-            # Initialize pullback low
-            if s.pullback_low is None:
-                s.pullback_low = price
-                return None
-            
-            # Pullback phase (price above low)
-            if price > s.pullback_low:
-                return None
-            
-            # Breakout phase (price exceeds prior low)
-            if price < s.pullback_low:
-                s.last_signal_ts = ts
-                s.pullback_high = None
-                s.pullback_low = None
-                return "CONTINUATION_DN"
-        
-        elif s.in_trend_dn:
-            # VWAP or MA condition failed - reset pullback
-            s.pullback_low = None
+    @staticmethod
+    def _on_tick_none(price, vwap, ma, ts):
+        # No trend → nothing to continue
+        return None
+
+
+class ContinuationBook:
+    """
+    ContinuationEngine state for N symbols as parallel columns (SoA).
+
+    Row i holds what one ContinuationEngine.state would: pullback
+    extremes, trend flags, cooldown expiry and last signal ts. A batch of
+    ticks across symbols is then one kernel pass (tick_book) over
+    contiguous array('d') / array('b') buffers instead of N engine calls.
+
+    Signals and state transitions are identical to ContinuationEngine.
+    """
+
+    def __init__(self, symbols: Sequence[str], lookback_sec=30, cooldown_sec=20):
+        n = len(symbols)
+        self.symbols = tuple(symbols)
+        self.index: Dict[str, int] = {sym: i for i, sym in enumerate(self.symbols)}
+        self.lookback_sec = lookback_sec
+        self.cooldown_sec = cooldown_sec
+
+        self.pullback_high = array("d", [_NAN] * n)
+        self.pullback_low = array("d", [_NAN] * n)
+        self.in_trend_up = array("b", [0] * n)
+        self.in_trend_dn = array("b", [0] * n)
+        self.next_allowed_ts = array("d", [float(cooldown_sec)] * n)
+        self.last_signal_ts = array("d", [0.0] * n)
+
+    # ------------------------------------------------------------------
+    def update_trend_flags(self, symbol: str, mandate: "SessionMandate"):
+        """Row-wise ContinuationEngine.update_trend_flags()."""
+        i = self.index[symbol]
+
+        bias = None if mandate is None else mandate.bias
+        up = bias == "CALL"
+        dn = bias == "PUT"
+
+        # Bias flip (or bias lost) → reset pullback state
+        if up != self.in_trend_up[i] or dn != self.in_trend_dn[i]:
+            self.pullback_high[i] = _NAN
+            self.pullback_low[i] = _NAN
+
+        self.in_trend_up[i] = up
+        self.in_trend_dn[i] = dn
+
+    # ------------------------------------------------------------------
+    def on_ticks(
+        self,
+        idx: array,
+        price: array,
+        vwap: array,
+        ma: array,
+        ts: array,
+    ) -> array:
+        """
+        Apply a batch of ticks; tick j belongs to row idx[j].
+
+        Args:
+            idx: array('l') of row indices (see .index)
+            price, vwap, ma, ts: array('d') columns, one entry per tick
+
+        Returns:
+            array('b') of signal codes per tick
+            (0 = none, 1 = CONTINUATION_UP, 2 = CONTINUATION_DN)
+        """
+        codes = array("b", bytes(len(idx)))
+        tick_book(
+            idx, price, vwap, ma, ts,
+            self.in_trend_up, self.in_trend_dn,
+            self.pullback_high, self.pullback_low,
+            self.next_allowed_ts, self.last_signal_ts,
+            float(self.cooldown_sec), codes,   # one specialisation (see _warmup)
+        )
+        return codes
+
+    # ------------------------------------------------------------------
+    def on_tick(self, symbol: str, price: float, vwap: float, ma: float, ts: float) -> Optional[str]:
+        """Single-symbol tick; same contract as ContinuationEngine.on_tick()."""
+        i = self.index[symbol]
+
+        code, self.pullback_high[i], self.pullback_low[i], self.next_allowed_ts[i] = tick_core(
+            price, vwap, ma, ts,
+            self.in_trend_up[i] != 0, self.in_trend_dn[i] != 0,
+            self.pullback_high[i], self.pullback_low[i],
+            self.next_allowed_ts[i],
+            self.cooldown_sec,
+        )
+
+        if code:
+            self.last_signal_ts[i] = ts
 
-        return None
\ No newline at end of file
+        return _SIGNAL_NAMES[code]
@@ -21,20 +21,54 @@ Invariants:
     4. Pure input → output transformation
 """
 
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from array import array
+from typing import Final, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from bot_0dte.strategy._scoring_jit import (
+    BASE_SCORE_RECLAIM,
+    BASE_SCORE_TREND,
+    BOOST_HIGH_DEV,
+    BOOST_STRONG_SLOPE,
+    GRADE_A_PLUS_THRESHOLD,
+    GRADE_A_THRESHOLD,
+    score_batch,
+    score_kernel,
+)
 
 if TYPE_CHECKING:
     from bot_0dte.strategy.session_mandate import SessionMandate
 
 
-@dataclass
-class EliteSignal:
+# ============================================================================
+# SCORING CONFIGURATION
+# ============================================================================
+# Score / grade constants are owned by the scoring kernel (_scoring_jit)
+# and imported above. Trail multipliers are only used for the Python-side
+# lookup. EliteEntryEngine re-exposes all of them as class attributes.
+
+# Trail multipliers
+_TRAIL_TREND: Final[float] = 1.25
+_TRAIL_RECLAIM_A: Final[float] = 1.30
+_TRAIL_RECLAIM_A_PLUS: Final[float] = 1.40
+
+# (grade, trail) by grade code (number of grade thresholds met), plus
+# per-column projections for build_signal_batch()
+_GRADE_TABLE: Final = (
+    ("B", _TRAIL_TREND),
+    ("A", _TRAIL_RECLAIM_A),
+    ("A+", _TRAIL_RECLAIM_A_PLUS),
+)
+_GRADE_BY_CODE: Final = tuple(grade for grade, _ in _GRADE_TABLE)
+_TRAIL_BY_CODE: Final = tuple(trail for _, trail in _GRADE_TABLE)
+
+
+class EliteSignal(NamedTuple):
     """
     Entry signal produced by EliteEntryEngine.
     
     All fields are informational for execution and logging.
     Permission has already been granted by SessionMandate.
+    Immutable once built (a tuple: one C-level allocation per signal).
     """
     bias: str  # "CALL" or "PUT"
     grade: str  # "A+", "A", "B" (for logging/tier)
@@ -43,6 +77,27 @@ class EliteSignal:
     trail_mult: float  # Trail multiplier for risk management
 
 
+def _score_signal(
+    is_reclaim: bool,
+    vwap_dev: float,
+    vwap_dev_change: float,
+) -> Tuple[float, str, float]:
+    """
+    Score / grade / trail for one approved entry.
+
+    Shared by build_signal() and build_signal_batch().
+
+    Returns:
+        (score, grade, trail_mult)
+    """
+    # Numeric core is compiled (score_kernel); only the code → grade /
+    # trail lookups stay in Python.
+    # Grade code = thresholds met: 0 → B, 1 → A (70+), 2 → A+ (90+)
+    score, code = score_kernel(is_reclaim, vwap_dev, vwap_dev_change)
+    grade, trail_mult = _GRADE_TABLE[code]
+    return score, grade, trail_mult
+
+
 class EliteEntryEngine:
     """
     Pure signal builder.
@@ -51,26 +106,25 @@ class EliteEntryEngine:
     Does not make eligibility decisions.
     """
     
+    # Stateless: no instance dict, every attribute read resolves on the class
+    __slots__ = ()
+    
     # ========================================================================
-    # SCORING CONFIGURATION
+    # SCORING CONFIGURATION (aliases of the module / kernel constants)
     # ========================================================================
     
-    # Base scores by regime type
-    BASE_SCORE_TREND = 60.0
-    BASE_SCORE_RECLAIM = 70.0
+    BASE_SCORE_TREND = BASE_SCORE_TREND
+    BASE_SCORE_RECLAIM = BASE_SCORE_RECLAIM
     
-    # VWAP energy boosts (observability scoring)
-    BOOST_STRONG_SLOPE = 15.0  # abs(slope) > 0.05
-    BOOST_HIGH_DEV = 10.0      # abs(dev) > 0.15
+    BOOST_STRONG_SLOPE = BOOST_STRONG_SLOPE
+    BOOST_HIGH_DEV = BOOST_HIGH_DEV
     
-    # Grading thresholds
-    GRADE_A_PLUS_THRESHOLD = 90.0
-    GRADE_A_THRESHOLD = 70.0
+    GRADE_A_PLUS_THRESHOLD = GRADE_A_PLUS_THRESHOLD
+    GRADE_A_THRESHOLD = GRADE_A_THRESHOLD
     
-    # Trail multipliers
-    TRAIL_TREND = 1.25
-    TRAIL_RECLAIM_A = 1.30
-    TRAIL_RECLAIM_A_PLUS = 1.40
+    TRAIL_TREND = _TRAIL_TREND
+    TRAIL_RECLAIM_A = _TRAIL_RECLAIM_A
+    TRAIL_RECLAIM_A_PLUS = _TRAIL_RECLAIM_A_PLUS
     
     # ========================================================================
     # PUBLIC API
@@ -94,64 +148,87 @@ class EliteEntryEngine:
                 - bias: "CALL" or "PUT"
                 - regime_type: "TREND" or "RECLAIM"
                 - confidence: 0.0 to 1.0 (not used for scoring)
-            snap: Market snapshot with:
+            snap: Market snapshot with (required keys; None → 0.0):
                 - vwap_dev: Price deviation from VWAP
                 - vwap_dev_change: Change in deviation (slope)
         
         Returns:
             EliteSignal ready for execution
         """
+        return self.build_signal_values(
+            mandate,
+            snap["vwap_dev"] or 0.0,
+            snap["vwap_dev_change"] or 0.0,
+        )
+    
+    def build_signal_values(
+        self,
+        mandate: "SessionMandate",
+        vwap_dev: float,
+        vwap_dev_change: float,
+    ) -> EliteSignal:
+        """
+        build_signal() for callers that already hold the VWAP floats.
         
-        # Extract fields from mandate
-        bias = mandate.bias
-        regime_type = mandate.regime_type or "TREND"
-        
-        # Extract VWAP energy from snap
-        vwap_dev = snap.get("vwap_dev", 0.0) or 0.0
-        vwap_dev_change = snap.get("vwap_dev_change", 0.0) or 0.0
-        
-        # ----------------------------------------------------------------
-        # SCORING
-        # ----------------------------------------------------------------
-        if regime_type == "TREND":
-            score = self.BASE_SCORE_TREND  # 60.0
-        else:  # RECLAIM
-            score = self.BASE_SCORE_RECLAIM  # 70.0
-        
-        # VWAP energy boosts
-        if abs(vwap_dev_change) > 0.05:
-            score += self.BOOST_STRONG_SLOPE  # +15
+        Same PRECONDITION as build_signal(). Inputs must be floats (no
+        None coalescing); this skips the snapshot dict entirely.
         
-        if abs(vwap_dev) > 0.15:
-            score += self.BOOST_HIGH_DEV  # +10
+        Returns:
+            EliteSignal ready for execution
+        """
+        regime_type = mandate.regime_type or "TREND"
         
-        # ----------------------------------------------------------------
-        # GRADING + TRAIL MULTIPLIER
-        # ----------------------------------------------------------------
-        # Both TREND and RECLAIM can earn grades based on score
-        # This is observability only - does not affect execution behavior
-        
-        if score >= self.GRADE_A_PLUS_THRESHOLD:  # 90+
-            grade = "A+"
-            trail_mult = self.TRAIL_RECLAIM_A_PLUS  # 1.40
-        elif score >= self.GRADE_A_THRESHOLD:  # 70+
-            grade = "A"
-            trail_mult = self.TRAIL_RECLAIM_A  # 1.30
-        else:
-            grade = "B"
-            trail_mult = self.TRAIL_TREND  # 1.25
+        score, grade, trail_mult = _score_signal(
+            regime_type != "TREND", vwap_dev, vwap_dev_change
+        )
         
         # ----------------------------------------------------------------
         # CONSTRUCT SIGNAL
         # ----------------------------------------------------------------
         return EliteSignal(
-            bias=bias,
+            bias=mandate.bias,
             grade=grade,
             regime=regime_type,
-            score=float(score),
-            trail_mult=float(trail_mult),
+            score=score,
+            trail_mult=trail_mult,
         )
     
+    def build_signal_batch(
+        self,
+        regime_types: Sequence[Optional[str]],
+        vwap_devs: Sequence[float],
+        vwap_dev_changes: Sequence[float],
+    ) -> Tuple[array, List[str], array]:
+        """
+        Score N approved snapshots in one pass (replay / backtest).
+        
+        Columnar in, columnar out: element i is exactly what
+        build_signal() would produce for (regime_types[i], vwap_devs[i],
+        vwap_dev_changes[i]), without building N dicts and N EliteSignals.
+        
+        Args:
+            regime_types: mandate.regime_type per row (None → "TREND")
+            vwap_devs: Price deviation from VWAP per row
+            vwap_dev_changes: Change in deviation (slope) per row
+        
+        Returns:
+            (scores, grades, trail_mults) — array('d'), list, array('d')
+        """
+        n = len(regime_types)
+        is_reclaim = array("b", [(r or "TREND") != "TREND" for r in regime_types])
+        devs = array("d", [d or 0.0 for d in vwap_devs])
+        changes = array("d", [c or 0.0 for c in vwap_dev_changes])
+        
+        # Numeric pass is one compiled loop; codes map back in Python
+        scores = array("d", bytes(8 * n))
+        codes = array("b", bytes(n))
+        score_batch(is_reclaim, devs, changes, scores, codes)
+        
+        grades = [_GRADE_BY_CODE[c] for c in codes]
+        trails = array("d", [_TRAIL_BY_CODE[c] for c in codes])
+        
+        return scores, grades, trails
+    
     # ========================================================================
     # DEPRECATED METHODS (for reference during migration)
     # ========================================================================
@@ -187,4 +264,86 @@ class EliteEntryEngine:
         raise NotImplementedError(
             "qualify() has been removed. "
             "Use SessionMandateEngine.determine() + build_signal() instead."
-        )
\ No newline at end of file
+        )
+
+
+# ============================================================================
+# SIGNAL RECORDING (replay / backtest logging)
+# ============================================================================
+
+_GRADE_CODE: Final = {grade: code for code, grade in enumerate(_GRADE_BY_CODE)}
+_BIAS_BY_CODE: Final = (None, "CALL", "PUT")
+_BIAS_CODE: Final = {bias: code for code, bias in enumerate(_BIAS_BY_CODE)}
+_REGIME_BY_CODE: Final = ("TREND", "RECLAIM")
+_REGIME_CODE: Final = {regime: code for code, regime in enumerate(_REGIME_BY_CODE)}
+
+# One JSONL row; floats are written with repr-equivalent precision
+_ROW_FMT: Final = (
+    '{{"ts": {!r}, "bias": {}, "grade": "{}", "regime": "{}", '
+    '"score": {!r}, "trail_mult": {!r}}}\n'
+)
+
+
+class SignalRingBuffer:
+    """
+    Fixed-capacity columnar record of built signals.
+    
+    append() writes one row into preallocated array columns (no dict, no
+    JSON); flush() serializes everything buffered in one pass. When more
+    than `capacity` signals arrive between flushes the oldest rows are
+    overwritten, so memory stays bounded during long replays.
+    
+    Recording is opt-in (the caller appends); build_signal() stays pure.
+    """
+    
+    def __init__(self, capacity: int = 65536):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.ts = array("d", bytes(8 * capacity))
+        self.score = array("d", bytes(8 * capacity))
+        self.trail_mult = array("d", bytes(8 * capacity))
+        self.grade = array("b", bytes(capacity))
+        self.bias = array("b", bytes(capacity))
+        self.regime = array("b", bytes(capacity))
+        self._count = 0  # rows appended since the last flush
+    
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+    
+    def append(self, ts: float, signal: EliteSignal) -> None:
+        """Record one signal (regime must be TREND or RECLAIM)."""
+        i = self._count % self.capacity
+        self.ts[i] = ts
+        self.score[i] = signal.score
+        self.trail_mult[i] = signal.trail_mult
+        self.grade[i] = _GRADE_CODE[signal.grade]
+        self.bias[i] = _BIAS_CODE[signal.bias]
+        self.regime[i] = _REGIME_CODE[signal.regime]
+        self._count += 1
+    
+    def flush(self, fp) -> int:
+        """
+        Write buffered rows oldest-first as JSON lines to `fp` and reset.
+        
+        Returns:
+            Number of rows written
+        """
+        n = len(self)
+        start = self._count - n
+        cap = self.capacity
+        rows = []
+        for k in range(start, self._count):
+            i = k % cap
+            bias = _BIAS_BY_CODE[self.bias[i]]
+            rows.append(_ROW_FMT.format(
+                self.ts[i],
+                "null" if bias is None else f'"{bias}"',
+                _GRADE_BY_CODE[self.grade[i]],
+                _REGIME_BY_CODE[self.regime[i]],
+                self.score[i],
+                self.trail_mult[i],
+            ))
+        fp.write("".join(rows))
+        self._count = 0
+        return n
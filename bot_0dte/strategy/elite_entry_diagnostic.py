@@ -7,94 +7,173 @@ Adds controlled early-entry logic:
     • slope acceleration (slope_now > slope_prev)
     • gamma >= 0.0025
     • premium_ok flag required for TREND_UP / TREND_DN
-"""
 
-from dataclasses import dataclass
-from typing import Optional
+(disable with EliteEntryEngine(enable_phase1_filters=False))
 
+qualify() takes a DiagnosticSnap (slotted, NaN = missing); build one
+from an orchestrator snap dict with DiagnosticSnap.from_dict().
+"""
 
-@dataclass
-class EliteSignal:
-    bias: str
-    grade: str
-    regime: str
-    score: float
-    trail_mult: float
+from dataclasses import dataclass
+from math import fabs, isnan, nan
+from typing import Final, Optional
+
+from bot_0dte.strategy.elite_entry import EliteSignal
+
+# ============================================================================
+# THRESHOLDS / SCORING
+# ============================================================================
+# Module-level so qualify() reads globals instead of walking the
+# instance → class lookup per gate. EliteEntryEngine re-exposes them as
+# class attributes.
+
+# Relaxed VWAP thresholds
+_SLOPE_MIN: Final[float] = 0.0005
+_DEV_MIN: Final[float] = 0.01
+
+# RECLAIM thresholds
+_SLOPE_RECLAIM: Final[float] = 0.0
+_DEV_RECLAIM: Final[float] = 0.10
+
+# New Phase-1 filters
+_UPVOL_MIN: Final[int] = 55
+_GAMMA_MIN: Final[float] = 0.0025
+_REQUIRE_PREMIUM_OK: Final[bool] = True
+
+# Scoring
+_BASE_TREND: Final[float] = 50.0
+_BASE_RECLAIM: Final[float] = 70.0
+_BOOST_STRONG_SLOPE: Final[float] = 10.0
+
+_GRADE_A_PLUS: Final[float] = 85.0
+_TRAIL_A: Final[float] = 1.25
+_TRAIL_A_PLUS: Final[float] = 1.35
+
+# (grade, trail) indexed by score >= GRADE_A_PLUS
+_GRADE_TABLE: Final = (("A", _TRAIL_A), ("A+", _TRAIL_A_PLUS))
+
+
+def _decision(base: float, strong_slope: bool):
+    score = base + _BOOST_STRONG_SLOPE * strong_slope
+    return (score,) + _GRADE_TABLE[score >= _GRADE_A_PLUS]
+
+
+# (score, grade, trail) for every qualify() outcome, precomputed from the
+# constants above: indexed [is_reclaim][abs(slope) > 0.02]
+_DECISION_TABLE: Final = tuple(
+    (_decision(base, False), _decision(base, True))
+    for base in (_BASE_TREND, _BASE_RECLAIM)
+)
+
+
+def _num(value) -> float:
+    return nan if value is None else value
+
+
+@dataclass(slots=True, frozen=True)
+class DiagnosticSnap:
+    """
+    Fields qualify() reads, pre-extracted from the snap dict.
+
+    Missing numeric values are NaN rather than None: every gate is
+    written so a NaN input fails it, exactly as None did.
+    """
+    price: float = nan
+    vwap: float = nan
+    vwap_dev: float = nan
+    vwap_dev_change: float = nan
+    upvol_pct: float = nan
+    gamma: float = nan
+    slope_prev: float = nan
+    premium_ok: bool = False
+
+    @classmethod
+    def from_dict(cls, snap: dict) -> "DiagnosticSnap":
+        get = snap.get
+        return cls(
+            _num(get("price")),
+            _num(get("vwap")),
+            _num(get("vwap_dev")),
+            _num(get("vwap_dev_change")),
+            _num(get("upvol_pct")),
+            _num(get("gamma")),
+            _num(get("slope_prev")),
+            get("premium_ok", False),
+        )
 
 
 class EliteEntryEngine:
+    __slots__ = ("enable_phase1_filters",)
+
     # Relaxed VWAP thresholds
-    SLOPE_MIN = 0.0005
-    DEV_MIN   = 0.01
+    SLOPE_MIN = _SLOPE_MIN
+    DEV_MIN = _DEV_MIN
 
     # RECLAIM thresholds
-    SLOPE_RECLAIM = 0.0
-    DEV_RECLAIM = 0.10
+    SLOPE_RECLAIM = _SLOPE_RECLAIM
+    DEV_RECLAIM = _DEV_RECLAIM
 
     # New Phase-1 filters
-    UPVOL_MIN = 55
-    GAMMA_MIN = 0.0025
-    REQUIRE_PREMIUM_OK = True
+    UPVOL_MIN = _UPVOL_MIN
+    GAMMA_MIN = _GAMMA_MIN
+    REQUIRE_PREMIUM_OK = _REQUIRE_PREMIUM_OK
 
     # Scoring
-    BASE_TREND = 50
-    BASE_RECLAIM = 70
-    BOOST_STRONG_SLOPE = 10
+    BASE_TREND = _BASE_TREND
+    BASE_RECLAIM = _BASE_RECLAIM
+    BOOST_STRONG_SLOPE = _BOOST_STRONG_SLOPE
 
-    GRADE_A_PLUS = 85
-    TRAIL_A = 1.25
-    TRAIL_A_PLUS = 1.35
+    GRADE_A_PLUS = _GRADE_A_PLUS
+    TRAIL_A = _TRAIL_A
+    TRAIL_A_PLUS = _TRAIL_A_PLUS
 
-    # ================================================================
-    def qualify(self, snap: dict) -> Optional[EliteSignal]:
-        price = snap.get("price")
-        vwap = snap.get("vwap")
-        dev = snap.get("vwap_dev")
-        slope = snap.get("vwap_dev_change")
-        symbol = snap.get("symbol")
-
-        # NEW (optional)
-        upvol = snap.get("upvol_pct")
-        gamma = snap.get("gamma")
-        slope_prev = snap.get("slope_prev")  # orchestrator provides this
-        premium_ok = snap.get("premium_ok", False)
+    def __init__(self, enable_phase1_filters: bool = True):
+        # False → plain diagnostic qualifier (TREND signals skip the
+        # upvol / acceleration / gamma / premium filters)
+        self.enable_phase1_filters = enable_phase1_filters
 
+    # ================================================================
+    def qualify(self, snap: DiagnosticSnap) -> Optional[EliteSignal]:
         # -----------------------------
-        # Input validation
+        # Minimum movement (relaxed) — most ticks exit here.
+        # `not x >= t` also rejects NaN (missing)
         # -----------------------------
-        if price is None or vwap is None or dev is None or slope is None:
+        slope = snap.vwap_dev_change
+        abs_slope = fabs(slope)         # reused by the slope boost below
+        if not abs_slope >= _SLOPE_MIN:
             return None
 
-        # -----------------------------
-        # Minimum movement (relaxed)
-        # -----------------------------
-        if abs(slope) < self.SLOPE_MIN:
+        dev = snap.vwap_dev
+        if not fabs(dev) >= _DEV_MIN:
             return None
 
-        if abs(dev) < self.DEV_MIN:
+        # -----------------------------
+        # Input validation
+        # -----------------------------
+        price = snap.price
+        vwap = snap.vwap
+        if isnan(price) or isnan(vwap):
             return None
 
         # -----------------------------
         # RECLAIM (priority signal)
         # -----------------------------
-        bias = None
-        score = float(self.BASE_TREND)
-        regime = "TREND"
+        is_reclaim = True
 
-        if dev > self.DEV_RECLAIM and slope > self.SLOPE_RECLAIM:
+        if dev > _DEV_RECLAIM and slope > _SLOPE_RECLAIM:
             bias = "CALL"
-            score = float(self.BASE_RECLAIM)
             regime = "RECLAIM"
 
-        elif dev < -self.DEV_RECLAIM and slope < -self.SLOPE_RECLAIM:
+        elif dev < -_DEV_RECLAIM and slope < -_SLOPE_RECLAIM:
             bias = "PUT"
-            score = float(self.BASE_RECLAIM)
             regime = "RECLAIM"
 
         # -----------------------------
         # TREND logic (EARLY ENTRY path)
         # -----------------------------
         else:
+            is_reclaim = False
+
             # CALL early trend
             if price > vwap and slope > 0:
                 bias = "CALL"
@@ -111,38 +190,28 @@ class EliteEntryEngine:
             # ============================================================
             # Phase-1 Early Entry Filters (APPLY ONLY TO TREND signals)
             # ============================================================
+            if self.enable_phase1_filters:
+                # 1) Upvolume confirmation (NaN → reject)
+                if not snap.upvol_pct >= _UPVOL_MIN:
+                    return None
 
-            # 1) Upvolume confirmation
-            if upvol is None or upvol < self.UPVOL_MIN:
-                return None
-
-            # 2) Slope acceleration — must be increasing
-            if slope_prev is not None and slope <= slope_prev:
-                return None
-
-            # 3) Gamma convexity requirement
-            if gamma is None or gamma < self.GAMMA_MIN:
-                return None
+                # 2) Slope acceleration — must be increasing
+                #    (slope_prev is provided by the orchestrator; NaN → skip)
+                if slope <= snap.slope_prev:
+                    return None
 
-            # 4) Premium band check (StrikeSelector sets premium_ok)
-            if self.REQUIRE_PREMIUM_OK and not premium_ok:
-                return None
+                # 3) Gamma convexity requirement (NaN → reject)
+                if not snap.gamma >= _GAMMA_MIN:
+                    return None
 
-        # -----------------------------
-        # Scoring
-        # -----------------------------
-        if abs(slope) > 0.02:
-            score += self.BOOST_STRONG_SLOPE
+                # 4) Premium band check (StrikeSelector sets premium_ok)
+                if _REQUIRE_PREMIUM_OK and not snap.premium_ok:
+                    return None
 
         # -----------------------------
-        # Grade & trail
+        # Score, grade & trail (one table lookup)
         # -----------------------------
-        if score >= self.GRADE_A_PLUS:
-            grade = "A+"
-            trail_mult = float(self.TRAIL_A_PLUS)
-        else:
-            grade = "A"
-            trail_mult = float(self.TRAIL_A)
+        score, grade, trail_mult = _DECISION_TABLE[is_reclaim][abs_slope > 0.02]
 
         return EliteSignal(
             bias=bias,
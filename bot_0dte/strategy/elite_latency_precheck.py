@@ -10,168 +10,161 @@ A2-M Upgrades:
     • Symbol-specific latency cap (from universe)
     • Millisecond chain age check
     • A2-M microstructure tightening
+
+The numeric quote gates run in _precheck_jit.validate_core (numba when
+available); validate() only extracts tick fields and runs the
+dict-based microstructure / latency checks.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from array import array
+from math import nan
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple
 from bot_0dte import universe
+from bot_0dte.strategy import _precheck_jit as _core
+from bot_0dte.strategy._precheck_jit import REASONS, validate_batch, validate_core
 
 
-@dataclass
-class PrecheckResult:
+class PrecheckResult(NamedTuple):
     ok: bool
     limit_price: Optional[float] = None
     reason: Optional[str] = None
 
 
+# Rejections carry no per-call data, so each reason has one shared,
+# immutable result; only a pass allocates (it carries limit_price).
+# _REJECT_BY_CODE is indexed by validate_core's result code (0 = pass,
+# never looked up).
+_REJECT_BY_CODE = tuple(PrecheckResult(False, reason=r) for r in REASONS)
+_REJECT_WEAK_FLOW = PrecheckResult(False, reason="weak_flow")
+_REJECT_IV_SPIKE = PrecheckResult(False, reason="iv_spike")
+_REJECT_LATENCY = PrecheckResult(False, reason="latency_exceeded")
+
+
+# validate_core bias encoding
+_BIAS_SIGN = {"CALL": 1, "PUT": -1}
+
+
 class EliteLatencyPrecheck:
 
-    MAX_SPREAD_A = 0.20
-    MAX_SPREAD_A_PLUS = 0.30
+    # Read-only mirrors of the kernel constants (_precheck_jit). numba
+    # freezes those into validate_core at compile time, so overriding
+    # these on the class or an instance changes nothing — edit
+    # _precheck_jit instead.
+    MAX_SPREAD_A = _core.MAX_SPREAD_A
+    MAX_SPREAD_A_PLUS = _core.MAX_SPREAD_A_PLUS
 
-    MAX_SLIPPAGE_A = 0.12
-    MAX_SLIPPAGE_A_PLUS = 0.18
+    MAX_SLIPPAGE_A = _core.MAX_SLIPPAGE_A
+    MAX_SLIPPAGE_A_PLUS = _core.MAX_SLIPPAGE_A_PLUS
 
-    MAX_MID_DRIFT = 0.10
-    MIN_SIZE = 5
+    MAX_MID_DRIFT = _core.MAX_MID_DRIFT
+    MIN_SIZE = _core.MIN_SIZE
 
     # v3.1 used 2.0 seconds — A2-M uses ms implicitly
-    MAX_CHAIN_AGE = 2.0  # sec fallback for old data
+    MAX_CHAIN_AGE = _core.MAX_CHAIN_AGE  # sec fallback for old data
 
-    REVERSAL_CALL = -0.01
-    REVERSAL_PUT = 0.01
+    REVERSAL_CALL = _core.REVERSAL_CALL
+    REVERSAL_PUT = _core.REVERSAL_PUT
 
     # ---------------------------------------------------------
     # A2-M PARAMETERS
     # ---------------------------------------------------------
-    MIN_GAMMA = 0.002          # dead-option protection
-    MAX_DELTA_OFF_TARGET = 0.18  # delta too misaligned becomes toxic
+    MIN_GAMMA = _core.MIN_GAMMA                        # dead-option protection
+    MAX_DELTA_OFF_TARGET = _core.MAX_DELTA_OFF_TARGET  # delta too misaligned becomes toxic
+
+    def validate(self, symbol: str, tick: dict, bias: str, grade: str, snap: Optional[dict] = None) -> PrecheckResult:
+        return self._check(
+            tick, _BIAS_SIGN.get(bias, 0), grade == "A+", snap,
+            universe.max_premium(symbol),
+            universe.max_latency_ms(symbol),
+        )
+
+    def validate_coded(
+        self,
+        symbol: str,
+        tick: dict,
+        bias_sign: int,
+        a_plus: bool,
+        snap: Optional[dict] = None,
+    ) -> PrecheckResult:
+        """
+        validate() for callers that already hold integer codes.
+        
+        bias_sign is +1 CALL / -1 PUT (0 = neither), a_plus is
+        grade == "A+" — the same encoding as validate_batch().
+        """
+        return self._check(
+            tick, bias_sign, a_plus, snap,
+            universe.max_premium(symbol),
+            universe.max_latency_ms(symbol),
+        )
 
-    def validate(self, symbol: str, tick: dict, bias: str, grade: str, snap: dict = None) -> PrecheckResult:
+    def bind(self, symbol: str) -> Callable[..., PrecheckResult]:
+        """
+        validate() specialised to one symbol.
+        
+        Resolves the symbol's premium ceiling and latency cap once, so
+        the returned validate_bound(tick, bias, grade, snap=None) does
+        no universe lookups per tick. The ceiling is weekday-dependent:
+        bind once per session, not across days.
+        """
+        ceiling = universe.max_premium(symbol)
+        max_lat = universe.max_latency_ms(symbol)
+        check = self._check
+
+        def validate_bound(tick: dict, bias: str, grade: str, snap: Optional[dict] = None) -> PrecheckResult:
+            return check(tick, _BIAS_SIGN.get(bias, 0), grade == "A+", snap, ceiling, max_lat)
+
+        return validate_bound
+
+    def _check(
+        self,
+        tick: dict,
+        bias_sign: int,
+        a_plus: bool,
+        snap: Optional[dict],
+        ceiling: float,
+        max_lat: float,
+    ) -> PrecheckResult:
+        # bias / grade arrive pre-resolved to integer codes (the
+        # validate* entry points), so every bias test below is an int compare
 
         price = tick.get("price")
         bid = tick.get("bid")
         ask = tick.get("ask")
         bid_size = tick.get("bid_size")
         ask_size = tick.get("ask_size")
-        slope = tick.get("vwap_dev_change") or 0.0
+        delta = tick.get("delta")
+        gamma = tick.get("gamma")
 
         # A2-M: allow `_chain_age_ms` OR fallback `_chain_age`
         chain_age_ms = tick.get("_chain_age_ms")
-        chain_age_s = tick.get("_chain_age", 0.0)
-
         chain_age = (
-            chain_age_ms / 1000.0 if chain_age_ms is not None else chain_age_s
+            chain_age_ms / 1000.0 if chain_age_ms is not None
+            else tick.get("_chain_age", 0.0)
         )
 
-        delta = tick.get("delta")
-        gamma = tick.get("gamma")
-
-        # ------------------------------------
-        # REQUIRED
         # ------------------------------------
-        if price is None or bid is None or ask is None:
-            return PrecheckResult(False, reason="missing_prices")
-
-        if bid <= 0 or ask <= 0:
-            return PrecheckResult(False, reason="invalid_quotes")
-
-        # ------------------------------------
-        # LOCKED / CROSSED
-        # ------------------------------------
-        if bid >= ask:
-            return PrecheckResult(False, reason="locked_market")
-
-        # ------------------------------------
-        # CHAIN AGE (A2-M hot path check)
-        # ------------------------------------
-        if chain_age > self.MAX_CHAIN_AGE:
-            return PrecheckResult(False, reason="stale_nbbo")
-
-        mid = (bid + ask) / 2
-        limit_side = ask if bias == "CALL" else bid
-
-        spread = ask - bid
-        spread_pct = spread / max(price, 0.01)
-        max_spread = self.MAX_SPREAD_A_PLUS if grade == "A+" else self.MAX_SPREAD_A
-
-        max_slippage = (
-            self.MAX_SLIPPAGE_A_PLUS if grade == "A+" else self.MAX_SLIPPAGE_A
+        # NUMERIC GATES (compiled kernel; None → NaN)
+        #   required → locked → chain age → spread / mid drift /
+        #   slippage (bias-ordered) → premium ceiling → delta / gamma
+        #   → reversal → liquidity
+        # ------------------------------------
+        code = validate_core(
+            nan if price is None else price,
+            nan if bid is None else bid,
+            nan if ask is None else ask,
+            nan if bid_size is None else bid_size,
+            nan if ask_size is None else ask_size,
+            tick.get("vwap_dev_change") or 0.0,
+            chain_age,
+            nan if delta is None else delta,
+            nan if gamma is None else gamma,
+            bias_sign,
+            a_plus,
+            ceiling,
         )
-        slippage = abs(limit_side - price) / max(price, 0.01)
-
-        # ====================================
-        # CALL ORDER:
-        #   1) spread
-        #   2) mid drift
-        #   3) slippage
-        # ====================================
-        if bias == "CALL":
-
-            if spread_pct > max_spread:
-                return PrecheckResult(False, reason="wide_spread")
-
-            mid_drift = abs(mid - price) / max(price, 0.01)
-            if mid_drift > self.MAX_MID_DRIFT:
-                return PrecheckResult(False, reason="mid_drift")
-
-            if slippage > max_slippage:
-                return PrecheckResult(False, reason="slippage_risk")
-
-        # ====================================
-        # PUT ORDER:
-        #   1) slippage
-        #   2) spread
-        #   3) mid drift
-        # ====================================
-        else:
-
-            if slippage > max_slippage:
-                return PrecheckResult(False, reason="slippage_risk")
-
-            if spread_pct > max_spread:
-                return PrecheckResult(False, reason="wide_spread")
-
-            mid_drift = abs(mid - price) / max(price, 0.01)
-            if mid_drift > self.MAX_MID_DRIFT:
-                return PrecheckResult(False, reason="mid_drift")
-
-        # ------------------------------------
-        # A2-M: PREMIUM CEILING PROTECTION
-        # ------------------------------------
-        ceiling = universe.max_premium(symbol)
-        if mid > ceiling:
-            return PrecheckResult(False, reason="premium_ceiling")
-
-        # ------------------------------------
-        # A2-M: DELTA & GAMMA CONVEXITY GUARD
-        # ------------------------------------
-        if delta is not None:
-            # Too far from 0.30 / -0.30 loses asymmetry
-            if (
-                (bias == "CALL" and abs(delta - 0.30) > self.MAX_DELTA_OFF_TARGET)
-                or (bias == "PUT" and abs(delta + 0.30) > self.MAX_DELTA_OFF_TARGET)
-            ):
-                return PrecheckResult(False, reason="delta_misaligned")
-
-        if gamma is not None and gamma < self.MIN_GAMMA:
-            return PrecheckResult(False, reason="low_gamma")
-
-        # ------------------------------------
-        # REVERSAL
-        # ------------------------------------
-        if bias == "CALL" and slope < self.REVERSAL_CALL:
-            return PrecheckResult(False, reason="micro_reversal")
-        if bias == "PUT" and slope > self.REVERSAL_PUT:
-            return PrecheckResult(False, reason="micro_reversal")
-
-        # ------------------------------------
-        # LIQUIDITY
-        # ------------------------------------
-        if bid_size is not None and bid_size < self.MIN_SIZE:
-            return PrecheckResult(False, reason="thin_liquidity")
-        if ask_size is not None and ask_size < self.MIN_SIZE:
-            return PrecheckResult(False, reason="thin_liquidity")
+        if code:
+            return _REJECT_BY_CODE[code]
 
         # ------------------------------------
         # MICROSTRUCTURE PROTECTION
@@ -183,19 +176,14 @@ class EliteLatencyPrecheck:
             upvol_pct = snap.get("upvol_pct")
             if upvol_pct is not None:
                 if not is_sim:
-                    if bias == "CALL" and upvol_pct < 60:
-                        return PrecheckResult(False, reason="weak_flow")
-                    if bias == "PUT" and upvol_pct > 40:
-                        return PrecheckResult(False, reason="weak_flow")
-
-            iv_change = snap.get("iv_change")
-            if iv_change is not None and abs(iv_change) > 0.20:
-                return PrecheckResult(False, reason="iv_spike")
-
+                    if bias_sign == 1 and upvol_pct < 60:
+                        return _REJECT_WEAK_FLOW
+                    if bias_sign == -1 and upvol_pct > 40:
+                        return _REJECT_WEAK_FLOW
 
             iv_change = snap.get("iv_change")
             if iv_change is not None and abs(iv_change) > 0.20:
-                return PrecheckResult(False, reason="iv_spike")
+                return _REJECT_IV_SPIKE
 
         # ------------------------------------
         # A2-M: LATENCY PROTECTION (optional)
@@ -203,11 +191,48 @@ class EliteLatencyPrecheck:
         # ------------------------------------
         latency_ms = tick.get("latency_ms")
         if latency_ms is not None:
-            max_lat = universe.max_latency_ms(symbol)
             if latency_ms > max_lat:
-                return PrecheckResult(False, reason="latency_exceeded")
+                return _REJECT_LATENCY
 
         # ------------------------------------
         # SUCCESS
         # ------------------------------------
-        return PrecheckResult(ok=True, limit_price=limit_side)
+        return PrecheckResult(ok=True, limit_price=ask if bias_sign == 1 else bid)
+
+    def validate_batch(
+        self,
+        symbols: Sequence[str],
+        prices: array,
+        bids: array,
+        asks: array,
+        bid_sizes: array,
+        ask_sizes: array,
+        slopes: array,
+        chain_ages: array,
+        deltas: array,
+        gammas: array,
+        bias_signs: array,
+        a_plus: array,
+    ) -> Tuple[array, array]:
+        """
+        Numeric gates of validate() for N contracts in one kernel call.
+        
+        Columnar in, columnar out. Inputs are array('d') with NaN for
+        missing values, plus bias_signs (+1 CALL / -1 PUT) and a_plus
+        (0/1) as array('b'); chain_ages are in seconds. Row i gets the
+        result code validate() would reach through the liquidity gate
+        (REASONS[code]; 0 = pass). The snap-based microstructure and
+        latency checks are per-call only and are not applied here.
+        
+        Returns:
+            (codes, limit_prices) — array('b'), array('d')
+        """
+        n = len(symbols)
+        ceilings = array("d", [universe.max_premium(s) for s in symbols])
+        codes = array("b", bytes(n))
+        limits = array("d", bytes(8 * n))
+        validate_batch(
+            prices, bids, asks, bid_sizes, ask_sizes, slopes, chain_ages,
+            deltas, gammas, bias_signs, a_plus, ceilings, codes, limits,
+        )
+        return codes, limits
@@ -8,23 +8,66 @@ Changes:
 - Spread/slippage/reversal are metrics, not gates
 - All measurements logged, none block entry
 - limit_price still provided for execution
+- spread / slippage / limit price come from the same numeric core as
+  EliteLatencyPrecheck (_precheck_jit.measure_core)
+- measure() takes a LatencyTick (slotted, NaN = missing); build one from
+  a tick dict with LatencyTick.from_dict()
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Any
+from math import isnan, nan
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 
+from bot_0dte.strategy._precheck_jit import MEASURE_ERRORS, measure_batch, measure_core
 
-@dataclass
-class LatencyMetrics:
+
+class LatencyMetrics(NamedTuple):
     """Execution quality measurements (observability only)."""
     
     spread_pct: float
     slippage_pct: float
-    reversal_slope: float
-    limit_price: float
+    reversal_slope: Optional[float]
+    limit_price: Optional[float]
     
     # Error field for missing data
-    error: str = None
+    error: Optional[str] = None
+
+
+# Error results carry no per-call data, so each error has one shared,
+# immutable result; only a measurement allocates. Same order as
+# MEASURE_ERRORS.
+_ERR_MISSING_PRICES, _ERR_ZERO_QUOTE, _ERR_NON_POSITIVE_PRICE = (
+    LatencyMetrics(0.0, 0.0, 0.0, None, err) for err in MEASURE_ERRORS[1:]
+)
+
+
+@dataclass(slots=True, frozen=True)
+class LatencyTick:
+    """
+    Fields measure() reads, pre-extracted from the tick dict.
+
+    Missing prices are NaN rather than None. vwap_dev_change keeps the
+    dict's value as-is (0.0 when the key is absent), since it is passed
+    through to LatencyMetrics.reversal_slope unchanged.
+    """
+    price: float = nan
+    bid: float = nan
+    ask: float = nan
+    vwap_dev_change: Optional[float] = 0.0
+
+    @classmethod
+    def from_dict(cls, tick: dict) -> "LatencyTick":
+        get = tick.get
+        price = get("price")
+        bid = get("bid")
+        ask = get("ask")
+        return cls(
+            nan if price is None else price,
+            nan if bid is None else bid,
+            nan if ask is None else ask,
+            get("vwap_dev_change", 0.0),
+        )
 
 
 class LatencyPrecheck:
@@ -42,89 +85,94 @@ class LatencyPrecheck:
         self.REVERSAL_THRESHOLD = 0.01
 
     # ------------------------------------------------------------------
-    def measure(self, symbol: str, tick: dict, bias: str) -> LatencyMetrics:
+    def measure(self, symbol: str, tick: LatencyTick, bias: str) -> LatencyMetrics:
         """
         Measure execution quality metrics.
         
         Args:
             symbol: Trading symbol
-            tick: Market data dict
+            tick: LatencyTick (LatencyTick.from_dict(tick_dict))
             bias: "CALL" or "PUT"
         
-        Tick format:
-        {
-            "price": float,
-            "bid": float,
-            "ask": float,
-            "vwap_dev_change": float | None,
-            "_recv_ts": float | None,
-        }
-        
         Returns:
             LatencyMetrics with measurements (never blocks)
         """
+        return self.measure_coded(symbol, tick, 1 if bias == "CALL" else -1)
+
+    # ------------------------------------------------------------------
+    def measure_coded(self, symbol: str, tick: LatencyTick, bias_sign: int) -> LatencyMetrics:
+        """
+        measure() for callers that already hold the bias as an integer.
+        
+        bias_sign is +1 CALL / -1 PUT — the same encoding as
+        measure_batch() and EliteLatencyPrecheck.validate_coded().
+        """
         
         # =====================================================
         # EXTRACT PRICES
         # =====================================================
-        price = tick.get("price")
-        bid = tick.get("bid")
-        ask = tick.get("ask")
+        price = tick.price
+        bid = tick.bid
+        ask = tick.ask
         
-        if price is None or bid is None or ask is None:
-            return LatencyMetrics(
-                spread_pct=0.0,
-                slippage_pct=0.0,
-                reversal_slope=0.0,
-                limit_price=None,
-                error="missing_prices"
-            )
+        if isnan(price) or isnan(bid) or isnan(ask):
+            return _ERR_MISSING_PRICES
         
         if bid <= 0 or ask <= 0:
-            return LatencyMetrics(
-                spread_pct=0.0,
-                slippage_pct=0.0,
-                reversal_slope=0.0,
-                limit_price=None,
-                error="zero_bid_or_ask"
-            )
+            return _ERR_ZERO_QUOTE
         
-        mid = (bid + ask) / 2
+        if price <= 0:
+            return _ERR_NON_POSITIVE_PRICE
         
         # =====================================================
-        # MEASURE: Spread
+        # MEASURE: Spread / slippage, CONSTRUCT LIMIT PRICE
+        # (shared quote arithmetic, _precheck_jit.measure_core)
         # =====================================================
-        spread = ask - bid
-        spread_pct = spread / max(mid, 0.01)
-        
-        # =====================================================
-        # MEASURE: Slippage
-        # =====================================================
-        if bias == "CALL":
-            slippage_pct = (ask - price) / max(price, 0.01)
-        else:
-            slippage_pct = (price - bid) / max(price, 0.01)
+        spread_pct, slippage_pct, limit_price = measure_core(price, bid, ask, bias_sign)
         
         # =====================================================
         # MEASURE: Reversal slope
         # =====================================================
-        reversal_slope = tick.get("vwap_dev_change", 0.0)
-        
-        # =====================================================
-        # CONSTRUCT LIMIT PRICE
-        # =====================================================
-        limit_price = ask if bias == "CALL" else bid
+        reversal_slope = tick.vwap_dev_change
         
         # =====================================================
         # RETURN MEASUREMENTS (NO VETO)
         # =====================================================
-        return LatencyMetrics(
-            spread_pct=spread_pct,
-            slippage_pct=slippage_pct,
-            reversal_slope=reversal_slope,
-            limit_price=limit_price
-        )
+        return LatencyMetrics(spread_pct, slippage_pct, reversal_slope, limit_price)
     
+    # ------------------------------------------------------------------
+    def measure_batch(
+        self,
+        prices: array,
+        bids: array,
+        asks: array,
+        bias_signs: array,
+    ) -> Tuple[array, array, array, array]:
+        """
+        measure() for N contracts in one kernel call.
+        
+        Columnar in, columnar out. prices / bids / asks are array('d')
+        with NaN for missing values; bias_signs is array('b') (+1 CALL,
+        -1 PUT). reversal_slope is measure()'s pass-through of
+        vwap_dev_change, so the caller's own column already is that
+        result and it is not copied here.
+        
+        Returns:
+            (spread_pcts, slippage_pcts, limit_prices, errors) —
+            array('d') ×3 (NaN limit on error rows) and array('b') of
+            MEASURE_ERRORS codes (0 = measured)
+        """
+        n = len(prices)
+        spread_pcts = array("d", bytes(8 * n))
+        slippage_pcts = array("d", bytes(8 * n))
+        limit_prices = array("d", bytes(8 * n))
+        errors = array("b", bytes(n))
+        measure_batch(
+            prices, bids, asks, bias_signs,
+            spread_pcts, slippage_pcts, limit_prices, errors,
+        )
+        return spread_pcts, slippage_pcts, limit_prices, errors
+
     # ------------------------------------------------------------------
     # DEPRECATED: Keep for backward compatibility
     # ------------------------------------------------------------------
@@ -132,20 +180,14 @@ class LatencyPrecheck:
         """
         DEPRECATED: Use measure() instead.
         
-        Returns dict with measurements for backward compatibility.
+        Takes the raw tick dict and returns a dict with measurements
+        for backward compatibility. Nothing in the tree calls it any
+        more; new code should use measure() and read attributes.
         """
-        metrics = self.measure(symbol, tick, bias)
+        metrics = self.measure(symbol, LatencyTick.from_dict(tick), bias)
         
-        return {
-            "spread_pct": metrics.spread_pct,
-            "slippage_pct": metrics.slippage_pct,
-            "reversal_slope": metrics.reversal_slope,
-            "limit_price": metrics.limit_price,
-            "error": metrics.error,
-            # For backward compat: always "ok"
-            "ok": True,
-            "reason": metrics.error or "measured"
-        }
+        # For backward compat: always "ok"
+        return {**metrics._asdict(), "ok": True, "reason": metrics.error or "measured"}
 
 
 # ======================================================================
@@ -155,17 +197,11 @@ class LatencyPrecheck:
 # In orchestrator _evaluate_entry():
 
 try:
-    metrics = self.latency.measure(symbol, tick, signal.bias)
+    metrics = self.latency.measure(symbol, LatencyTick.from_dict(tick), signal.bias)
     
-    # Log measurements (observability)
-    self.logger.log_event("latency_metrics", {
-        "symbol": symbol,
-        "spread_pct": round(metrics.spread_pct * 100, 2),
-        "slippage_pct": round(metrics.slippage_pct * 100, 2),
-        "reversal_slope": round(metrics.reversal_slope, 4),
-        "limit_price": metrics.limit_price,
-        "error": metrics.error,
-    })
+    # Log measurements (observability) — raw fractions; round when
+    # rendering the log, not per tick
+    self.logger.log_event("latency_metrics", {"symbol": symbol, **metrics._asdict()})
     
     # Note: No branching on metrics - always proceed to entry
     
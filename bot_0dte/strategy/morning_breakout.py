@@ -19,8 +19,76 @@ Standard Mode (fallback):
     • VWAP reclaim or rejection confirmed
     • moderate volume & flow
     • normal RR: tp=3R, sl=0.5R, trail=1.2
+
+qualify() takes a BreakoutSnap (slotted, NaN = missing); build one from
+an orchestrator snap dict with BreakoutSnap.from_dict(). The decision
+cascade runs in _breakout_jit.qualify_core (numba when available);
+qualify() only maps its signal code to the signal dict.
 """
 
+from dataclasses import dataclass
+from math import nan
+from types import MappingProxyType
+
+from bot_0dte.strategy import _breakout_jit as _core
+from bot_0dte.strategy._breakout_jit import MORNING_LIMIT_SEC as _MORNING_LIMIT_SEC, qualify_core
+
+
+def _num(value) -> float:
+    return nan if value is None else value
+
+
+@dataclass(slots=True, frozen=True)
+class BreakoutSnap:
+    """
+    Fields qualify() reads, pre-extracted from the snap dict.
+
+    Missing values are NaN rather than None. vwap_dev / vwap_dev_change
+    / seconds_since_open default to 0 when the key is absent, as the
+    dict-based qualify() did.
+    """
+    price: float = nan
+    vwap: float = nan
+    vwap_dev: float = 0.0
+    vwap_dev_change: float = 0.0
+    seconds_since_open: float = 0.0
+    upvol_pct: float = nan
+    flow_ratio: float = nan
+    iv_change: float = nan
+    skew_shift: float = nan
+
+    @classmethod
+    def from_dict(cls, snap: dict) -> "BreakoutSnap":
+        get = snap.get
+        return cls(
+            _num(get("price")),
+            _num(get("vwap")),
+            _num(get("vwap_dev", 0)),
+            _num(get("vwap_dev_change", 0)),
+            _num(get("seconds_since_open", 0)),
+            _num(get("upvol_pct")),
+            _num(get("flow_ratio")),
+            _num(get("iv_change")),
+            _num(get("skew_shift")),
+        )
+
+
+# Signal by qualify_core signal code (None = no signal). Signals carry
+# no per-snap data, so each is one shared, read-only mapping.
+_EARLY_RR = {"tp_mult": 5.0, "sl_mult": 0.35, "trail_mult": 1.3}
+_STANDARD_RR = {"tp_mult": 3.0, "sl_mult": 0.50, "trail_mult": 1.2}
+
+_SIGNALS = (None,) + tuple(MappingProxyType(sig) for sig in (
+    {"bias": "CALL", "regime": "TREND_EARLY", "grade": "A Early", "vol_path": "NEUTRAL", **_EARLY_RR},
+    {"bias": "CALL", "regime": "TREND_EARLY", "grade": "A+ Early", "vol_path": "SUPPORT", **_EARLY_RR},
+    {"bias": "PUT", "regime": "TREND_EARLY", "grade": "A Early", "vol_path": "NEUTRAL", **_EARLY_RR},
+    {"bias": "PUT", "regime": "TREND_EARLY", "grade": "A+ Early", "vol_path": "SUPPORT", **_EARLY_RR},
+    {"bias": "CALL", "regime": "RECLAIM", "grade": "A", "vol_path": "NEUTRAL", **_STANDARD_RR},
+    {"bias": "CALL", "regime": "RECLAIM", "grade": "A", "vol_path": "CONFIRM", **_STANDARD_RR},
+    {"bias": "PUT", "regime": "REJECT", "grade": "A", "vol_path": "NEUTRAL", **_STANDARD_RR},
+    {"bias": "PUT", "regime": "REJECT", "grade": "A", "vol_path": "CONFIRM", **_STANDARD_RR},
+))
+
 
 class MorningBreakout:
     """
@@ -30,61 +98,48 @@ class MorningBreakout:
     Gracefully degrades when microstructure data unavailable.
     """
 
-    def __init__(self, telemetry=None):
-        self.telemetry = telemetry
-
-        # Microstructure thresholds (optional enhancements)
-        self.MIN_UPVOL = 60
-        self.MIN_FLOW_CALL = 1.20
-        self.MAX_FLOW_PUT = 0.80
+    # Thresholds are owned by the kernel module (_breakout_jit), where
+    # numba freezes them into qualify_core. They are exposed read-only:
+    # assigning one raises instead of being silently ignored.
 
-        # Slope thresholds to avoid random noise
-        self.MIN_SLOPE_UP = 0.00
-        self.MIN_SLOPE_DN = 0.00
+    # Microstructure thresholds (optional enhancements)
+    MIN_UPVOL = property(lambda self: _core.MIN_UPVOL)
+    MIN_FLOW_CALL = property(lambda self: _core.MIN_FLOW_CALL)
+    MAX_FLOW_PUT = property(lambda self: _core.MAX_FLOW_PUT)
 
-        # Morning-only window
-        self.MORNING_LIMIT_SEC = 5400  # first 90 minutes (9:30 - 11:00 AM)
+    # Slope thresholds to avoid random noise
+    MIN_SLOPE_UP = property(lambda self: _core.MIN_SLOPE_UP)
+    MIN_SLOPE_DN = property(lambda self: _core.MIN_SLOPE_DN)
 
-    # ---------------------------------------------------------
-    def _is_morning(self, secs: float) -> bool:
-        """Check if within morning trading window."""
-        return secs <= self.MORNING_LIMIT_SEC
+    # Morning-only window — first 90 minutes (9:30 - 11:00 AM)
+    MORNING_LIMIT_SEC = property(lambda self: _core.MORNING_LIMIT_SEC)
 
-    # ---------------------------------------------------------
-    def _vol_support(self, iv_chg, skew) -> bool:
-        """Check if vol surface supports directional move."""
-        return iv_chg is not None and skew is not None and iv_chg > 0 and skew > 0
-
-    # ---------------------------------------------------------
-    def _vol_against(self, iv_chg, skew) -> bool:
-        """Check if vol surface contradicts directional move."""
-        return iv_chg is not None and skew is not None and iv_chg < 0 and skew < 0
+    def __init__(self, telemetry=None):
+        self.telemetry = telemetry
 
     # =========================================================
     # MAIN QUALIFIER
     # =========================================================
-    def qualify(self, snap: dict):
+    def qualify(self, snap: BreakoutSnap):
         """
         Evaluate enriched snapshot for breakout signal.
 
-        Expected snapshot format (from Orchestrator):
-        {
-            "symbol": str,
-            "price": float,
-            "vwap": float,                      # Computed by orchestrator
-            "vwap_dev": float,                  # price - vwap
-            "vwap_dev_change": float,           # Change in deviation
-            "seconds_since_open": float,
-
-            # Optional microstructure (may be None):
-            "upvol_pct": float | None,
-            "flow_ratio": float | None,
-            "iv_change": float | None,
-            "skew_shift": float | None,
-        }
+        Expected snapshot (BreakoutSnap.from_dict of the orchestrator snap):
+            price, vwap                         # required (NaN → no signal)
+            vwap_dev, vwap_dev_change           # price - vwap, its change
+            seconds_since_open
+
+            # Optional microstructure (NaN when unavailable):
+            upvol_pct, flow_ratio, iv_change, skew_shift
+
+        Layers (see _breakout_jit.qualify_core):
+            1. structure — pre-reclaim / pre-reject
+            2. microstructure — upvol / flow (passes when unavailable)
+            3. vol surface — booster, or veto of early entry
+            then standard-mode VWAP reclaim / rejection as fallback
 
         Returns:
-            Signal dict with:
+            Read-only signal mapping (shared — copy before mutating):
             {
                 "bias": "CALL" | "PUT",
                 "regime": str,
@@ -96,124 +151,20 @@ class MorningBreakout:
             }
             OR None if no signal
         """
-
-        # =====================================================
-        # REQUIRED FIELDS VALIDATION
-        # =====================================================
-        price = snap.get("price")
-        vwap = snap.get("vwap")
-        secs = snap.get("seconds_since_open", 0)
-
-        if price is None or vwap is None:
+        # Outside the morning window (most of the session) is one
+        # compare, without marshalling nine fields into the kernel
+        secs = snap.seconds_since_open
+        if not secs <= _MORNING_LIMIT_SEC:
             return None
 
-        if not self._is_morning(secs):
-            return None
-
-        # =====================================================
-        # CORE VWAP METRICS (always available from orchestrator)
-        # =====================================================
-        dev = snap.get("vwap_dev", 0)
-        slope = snap.get("vwap_dev_change", 0)
-
-        # =====================================================
-        # OPTIONAL MICROSTRUCTURE FIELDS
-        # Default to passing values if unavailable
-        # =====================================================
-        upvol = snap.get("upvol_pct")
-        flow = snap.get("flow_ratio")
-        ivc = snap.get("iv_change")
-        skew = snap.get("skew_shift")
-
-        # =====================================================
-        # LAYER 1 — STRUCTURE (pre-reclaim / pre-reject)
-        # =====================================================
-        pre_call = price < vwap and slope > self.MIN_SLOPE_UP
-        pre_put = price > vwap and slope < self.MIN_SLOPE_DN
-
-        # =====================================================
-        # LAYER 2 — MICROSTRUCTURE (optional enhancement)
-        # =====================================================
-        # If microstructure data unavailable, default to passing
-        # This allows strategy to work with price/VWAP only
-
-        if upvol is not None and flow is not None:
-            # Full microstructure available
-            micro_call = upvol >= self.MIN_UPVOL and flow >= self.MIN_FLOW_CALL
-            micro_put = upvol >= self.MIN_UPVOL and flow <= self.MAX_FLOW_PUT
-        else:
-            # No microstructure - default to passing
-            # Strategy degrades gracefully to price action only
-            micro_call = True
-            micro_put = True
-
-        # =====================================================
-        # LAYER 3 — VOL SURFACE (optional booster OR veto)
-        # =====================================================
-        vol_support = self._vol_support(ivc, skew)
-        vol_against = self._vol_against(ivc, skew)
-
-        # =====================================================
-        # EARLY ENTRY — CALL
-        # =====================================================
-        if pre_call and micro_call:
-            if not vol_against:
-                return {
-                    "bias": "CALL",
-                    "regime": "TREND_EARLY",
-                    "grade": "A+ Early" if vol_support else "A Early",
-                    "vol_path": "SUPPORT" if vol_support else "NEUTRAL",
-                    "tp_mult": 5.0,
-                    "sl_mult": 0.35,
-                    "trail_mult": 1.3,
-                }
-            # if vol_against → fall through to standard mode
-
-        # =====================================================
-        # EARLY ENTRY — PUT
-        # =====================================================
-        if pre_put and micro_put:
-            if not vol_against:
-                return {
-                    "bias": "PUT",
-                    "regime": "TREND_EARLY",
-                    "grade": "A+ Early" if vol_support else "A Early",
-                    "vol_path": "SUPPORT" if vol_support else "NEUTRAL",
-                    "tp_mult": 5.0,
-                    "sl_mult": 0.35,
-                    "trail_mult": 1.3,
-                }
-            # vol-against → fall through
-
-        # =====================================================
-        # STANDARD MODE (fallback)
-        # Clean VWAP reclaim / rejection logic
-        # =====================================================
-        reclaim = dev > 0 and slope > self.MIN_SLOPE_UP
-        reject = dev < 0 and slope < self.MIN_SLOPE_DN
-
-        # CALL reclaim
-        if reclaim:
-            return {
-                "bias": "CALL",
-                "regime": "RECLAIM",
-                "grade": "A",
-                "vol_path": "CONFIRM" if vol_support else "NEUTRAL",
-                "tp_mult": 3.0,
-                "sl_mult": 0.50,
-                "trail_mult": 1.2,
-            }
-
-        # PUT reject
-        if reject:
-            return {
-                "bias": "PUT",
-                "regime": "REJECT",
-                "grade": "A",
-                "vol_path": "CONFIRM" if vol_support else "NEUTRAL",
-                "tp_mult": 3.0,
-                "sl_mult": 0.50,
-                "trail_mult": 1.2,
-            }
-
-        return None
+        return _SIGNALS[qualify_core(
+            snap.price,
+            snap.vwap,
+            snap.vwap_dev,
+            snap.vwap_dev_change,
+            secs,
+            snap.upvol_pct,
+            snap.flow_ratio,
+            snap.iv_change,
+            snap.skew_shift,
+        )]
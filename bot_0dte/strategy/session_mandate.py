@@ -16,6 +16,7 @@ Invariants:
 
 from dataclasses import dataclass
 from enum import Enum
+from math import fabs, nan as _NAN
 from typing import Optional, Dict, Any
 import time
 
@@ -33,7 +34,27 @@ class RegimeState(Enum):
     NO_TRADE = "NO_TRADE"
 
 
-@dataclass
+# Bias by location sign: [+1] → CALL, [-1] → PUT ([0] = pinned, unused)
+_BIAS_BY_SIGN = (None, "CALL", "PUT")
+
+
+@dataclass(slots=True)
+class AcceptanceState:
+    """
+    Per-symbol acceptance tracking for SessionMandateEngine.
+
+    bias is the location sign (+1 CALL, -1 PUT, 0 none) so checks are int
+    compares; range extremes use NaN for "unset", which makes range-break
+    compares False until a range exists.
+    """
+    bias: int = 0
+    hold_bars: int = 0
+    range_high: float = _NAN
+    range_low: float = _NAN
+    last_hold_ts: Optional[float] = None
+
+
+@dataclass(slots=True, frozen=True)
 class SessionMandate:
     """
     Immutable permission object returned by SessionMandateEngine.
@@ -63,7 +84,7 @@ class SessionMandate:
             "state": self.state.value,
             "bias": self.bias,
             "regime_type": self.regime_type,
-            "confidence": round(self.confidence, 3),
+            "confidence": self.confidence,
             "reason": self.reason,
             "reference_price": self.reference_price,
             "allows_entry": self.allows_entry(),
@@ -95,7 +116,7 @@ class SessionMandateEngine:
     
     def __init__(self):
         # Acceptance state per symbol
-        self._acceptance: Dict[str, Dict[str, Any]] = {}
+        self._acceptance: Dict[str, AcceptanceState] = {}
         
         # Last exit timestamp (for cooldown)
         self._last_exit_ts: Optional[float] = None
@@ -139,10 +160,6 @@ class SessionMandateEngine:
         """
         refs = self._reference_prices.get(symbol, {})
         
-        def _log(msg: str):
-            if log_func is not None:
-                log_func(msg)
-        
         # Build ordered fallback chain: (label, value)
         # Check snap first for live values, then stored refs
         price_sources = [
@@ -155,33 +172,25 @@ class SessionMandateEngine:
         
         for label, price in price_sources:
             if price is not None and price > 0:
-                _log(f"[refprice] Using {label}: {price}")
+                # Only format the message when someone is listening
+                if log_func is not None:
+                    log_func(f"[refprice] Using {label}: {price}")
                 return price
         
-        _log("[refprice] No valid reference price found")
+        if log_func is not None:
+            log_func("[refprice] No valid reference price found")
         return None
     
-    def _get_acceptance_state(self, symbol: str) -> Dict[str, Any]:
+    def _get_acceptance_state(self, symbol: str) -> AcceptanceState:
         """Get or create acceptance state for symbol."""
-        if symbol not in self._acceptance:
-            self._acceptance[symbol] = {
-                "hold_bars": 0,
-                "range_high": None,
-                "range_low": None,
-                "bias": None,
-                "last_hold_ts": None,
-            }
-        return self._acceptance[symbol]
+        state = self._acceptance.get(symbol)
+        if state is None:
+            state = self._acceptance[symbol] = AcceptanceState()
+        return state
     
     def _reset_acceptance_state(self, symbol: str):
         """Reset acceptance state for symbol."""
-        self._acceptance[symbol] = {
-            "hold_bars": 0,
-            "range_high": None,
-            "range_low": None,
-            "bias": None,
-            "last_hold_ts": None,
-        }
+        self._acceptance[symbol] = AcceptanceState()
     
     def determine(
         self,
@@ -195,23 +204,25 @@ class SessionMandateEngine:
         
         Args:
             symbol: Trading symbol
-            snap: Market snapshot containing:
+            snap: Market snapshot containing (required keys; values may be None):
                 - price: Current underlying price
                 - vwap: Current VWAP (may be None early session)
                 - vwap_dev: Price - VWAP
                 - vwap_dev_change: Change in deviation
                 - seconds_since_open: Time since market open
-                - reference_price: Explicit reference (optional, from orchestrator)
+                - reference_price: Explicit reference (optional key, from orchestrator)
         
         Returns:
             SessionMandate with permission state and metadata
         """
         
-        price = snap.get("price")
-        vwap = snap.get("vwap")
-        vwap_dev = snap.get("vwap_dev")
-        vwap_dev_change = snap.get("vwap_dev_change")
-        seconds_since_open = snap.get("seconds_since_open", 0.0)
+        # Core fields are always present in the orchestrator's snapshot;
+        # a missing key is an upstream bug and raises KeyError
+        price = snap["price"]
+        vwap = snap["vwap"]
+        vwap_dev = snap["vwap_dev"]
+        vwap_dev_change = snap["vwap_dev_change"]
+        seconds_since_open = snap["seconds_since_open"]
         
         now = time.monotonic()
         
@@ -273,11 +284,9 @@ class SessionMandateEngine:
         dev = price - reference_price
         
         # Determine bias from location relative to reference
-        if dev > 0:
-            bias = "CALL"
-        elif dev < 0:
-            bias = "PUT"
-        else:
+        # (sign: +1 above, -1 below, 0 pinned — NaN also lands on 0)
+        sign = (dev > 0) - (dev < 0)
+        if sign == 0:
             # Pinned exactly at reference → no directional bias
             return SessionMandate(
                 state=RegimeState.NO_TRADE,
@@ -287,6 +296,7 @@ class SessionMandateEngine:
                 reason="pinned_at_reference",
                 reference_price=reference_price,
             )
+        bias = _BIAS_BY_SIGN[sign]
         
         # ================================================================
         # STEP 3: REGIME CLASSIFICATION (metadata only, does not gate)
@@ -295,15 +305,13 @@ class SessionMandateEngine:
         # TREND: location only (no slope requirement)
         # Note: slope requires VWAP to be meaningful
         
-        if vwap_available and vwap_dev_change is not None:
-            slope_aligned = (
-                (bias == "CALL" and vwap_dev_change > 0) or
-                (bias == "PUT" and vwap_dev_change < 0)
-            )
-            regime_type = "RECLAIM" if slope_aligned else "TREND"
-        else:
-            # No VWAP → default to TREND (location-only)
-            regime_type = "TREND"
+        # CALL needs slope > 0, PUT needs slope < 0
+        slope_aligned = (
+            vwap_available
+            and vwap_dev_change is not None
+            and sign * vwap_dev_change > 0
+        )
+        regime_type = "RECLAIM" if slope_aligned else "TREND"
         
         # ================================================================
         # STEP 4: ACCEPTANCE STATE MANAGEMENT
@@ -311,13 +319,13 @@ class SessionMandateEngine:
         state = self._get_acceptance_state(symbol)
         
         # Bias flip → reset acceptance
-        if state["bias"] != bias:
+        if state.bias != sign:
             self._reset_acceptance_state(symbol)
             state = self._get_acceptance_state(symbol)
-            state["bias"] = bias
-            state["range_high"] = price
-            state["range_low"] = price
-            state["last_hold_ts"] = now
+            state.bias = sign
+            state.range_high = price
+            state.range_low = price
+            state.last_hold_ts = now
         
         # ================================================================
         # STEP 5: ACCEPTANCE CRITERIA CHECK (before updating range)
@@ -326,72 +334,57 @@ class SessionMandateEngine:
         acceptance_reason = ""
         
         # Criterion 2: Range break (checked FIRST, before range update)
-        if bias == "CALL" and state["range_high"] is not None:
-            if price > state["range_high"]:
+        # NaN range (unset) compares False
+        if sign == 1:
+            if price > state.range_high:
                 acceptance_met = True
                 acceptance_reason = "range_break_high"
-        elif bias == "PUT" and state["range_low"] is not None:
-            if price < state["range_low"]:
-                acceptance_met = True
-                acceptance_reason = "range_break_low"
+        elif price < state.range_low:
+            acceptance_met = True
+            acceptance_reason = "range_break_low"
         
-        # Update range tracking (AFTER range break check)
-        if state["range_high"] is None or price > state["range_high"]:
-            state["range_high"] = price
-        if state["range_low"] is None or price < state["range_low"]:
-            state["range_low"] = price
+        # Update range tracking (AFTER range break check); `not <=` also
+        # replaces a NaN (unset) extreme
+        if not price <= state.range_high:
+            state.range_high = price
+        if not price >= state.range_low:
+            state.range_low = price
         
         # Check alignment for hold bar accumulation
         # Use VWAP if available, otherwise reference price
         alignment_ref = vwap if vwap_available else reference_price
-        aligned = (
-            (bias == "CALL" and price > alignment_ref) or
-            (bias == "PUT" and price < alignment_ref)
-        )
+        aligned = sign * (price - alignment_ref) > 0
         
         if aligned:
             # Accumulate hold bars
-            if state["last_hold_ts"] is None:
-                state["last_hold_ts"] = now
-            elif now - state["last_hold_ts"] >= self.HOLD_INTERVAL_SEC:
-                state["hold_bars"] += 1
-                state["last_hold_ts"] = now
+            if state.last_hold_ts is None:
+                state.last_hold_ts = now
+            elif now - state.last_hold_ts >= self.HOLD_INTERVAL_SEC:
+                state.hold_bars += 1
+                state.last_hold_ts = now
         else:
             # Reset hold bars on alignment violation
-            state["hold_bars"] = 0
-            state["last_hold_ts"] = None
+            state.hold_bars = 0
+            state.last_hold_ts = None
         
         # Criterion 1: Hold bars (from accumulation above)
-        if not acceptance_met and state["hold_bars"] >= self.HOLD_BARS_REQUIRED:
+        if not acceptance_met and state.hold_bars >= self.HOLD_BARS_REQUIRED:
             acceptance_met = True
             acceptance_reason = "hold_bars"
         
         # ================================================================
         # STEP 6: BUILD CONFIDENCE (metadata only)
         # ================================================================
-        # Base confidence
-        confidence = 0.5
-        
-        # Early session modifier (metadata, not gating)
-        if seconds_since_open < 300:
-            confidence = 0.3
-        
-        # VWAP unavailable modifier (metadata, not gating)
-        if not vwap_available:
-            confidence -= 0.1
-        
-        # Slope alignment boost (only if VWAP available)
-        if vwap_available and vwap_dev_change is not None:
-            slope_aligned = (
-                (bias == "CALL" and vwap_dev_change > 0) or
-                (bias == "PUT" and vwap_dev_change < 0)
-            )
-            if slope_aligned:
-                confidence += 0.2
-        
-        # Strong deviation boost
-        if abs(dev) > 0.15:
-            confidence += 0.1
+        # Branchless: base 0.5 (0.3 early session), then each modifier is
+        # its weight × a 0/1 condition. Summed in integer tenths so the
+        # result is the nearest float to k/10 and logs cleanly unrounded.
+        confidence = (
+            5
+            - 2 * (seconds_since_open < 300)     # early session
+            - 1 * (not vwap_available)           # VWAP unavailable
+            + 2 * slope_aligned                  # slope aligned (needs VWAP)
+            + 1 * (fabs(dev) > 0.15)             # strong deviation
+        ) / 10
         
         confidence = max(0.0, min(confidence, 1.0))
         
@@ -411,7 +404,7 @@ class SessionMandateEngine:
         if acceptance_met:
             reason_parts.append(f"accepted:{acceptance_reason}")
         else:
-            reason_parts.append(f"pending:hold_bars={state['hold_bars']}")
+            reason_parts.append(f"pending:hold_bars={state.hold_bars}")
         
         reason = "|".join(reason_parts)
         
@@ -8,11 +8,13 @@ Runs at 5:30am PT:
     • Tests WS connectivity
     • Tests IB Gateway (if paper_mode)
     • Tests OCC subscription flow
+    • Compiles / loads JIT kernels (numba on-disk cache)
     • Loads orchestrator without trading
 """
 
 import os
 import asyncio
+import importlib
 import sys
 import time
 from pathlib import Path
@@ -75,6 +77,43 @@ async def check_occ_subscription():
         return False
 
 
+# Modules whose import compiles (or loads from cache) their @njit kernels
+JIT_KERNEL_MODULES = (
+    "bot_0dte.strategy._continuation_jit",
+    "bot_0dte.strategy._scoring_jit",
+    "bot_0dte.strategy._precheck_jit",
+    "bot_0dte.strategy._breakout_jit",
+    "bot_0dte.sim._pricing_kernels",
+)
+
+
+def check_jit():
+    """
+    Import every kernel module so numba compiles them now (cache=True
+    writes the machine code to __pycache__). Market open then only loads
+    cached code instead of paying compile latency on the first tick.
+    """
+    print("\n⚙️  Warming JIT kernels...")
+
+    from bot_0dte.infra.jit import JIT_DISABLED, NUMBA_AVAILABLE
+
+    if JIT_DISABLED:
+        print("ℹ️  BOT_0DTE_DISABLE_JIT set — kernels run as plain Python")
+    elif not NUMBA_AVAILABLE:
+        print("⚠️  numba not installed — kernels run as plain Python")
+
+    t0 = time.perf_counter()
+    try:
+        for name in JIT_KERNEL_MODULES:
+            importlib.import_module(name)
+    except Exception as e:
+        print("❌ JIT kernel warmup failed:", e)
+        return False
+
+    print(f"✅ JIT kernels ready ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    return True
+
+
 async def main():
     print("\n==============================")
     print(" PRE-MARKET HEALTH CHECK v1.0 ")
@@ -85,6 +124,9 @@ async def main():
     if not check_env():
         ok = False
 
+    if not check_jit():
+        ok = False
+
     if not await check_massive():
         ok = False
 
@@ -0,0 +1,94 @@
+"""
+Unit tests for ContinuationEngine (VWAP-holding pullback entries).
+"""
+
+import math
+from array import array
+
+from bot_0dte.strategy.continuation_engine import ContinuationBook, ContinuationEngine
+
+
+class _Mandate:
+    def __init__(self, bias):
+        self.bias = bias
+
+
+def _engine(bias, cooldown_sec=20):
+    eng = ContinuationEngine(cooldown_sec=cooldown_sec)
+    eng.update_trend_flags(_Mandate(bias))
+    return eng
+
+
+class TestContinuationUp:
+    def test_breakout_after_pullback_fires(self):
+        eng = _engine("CALL")
+        assert eng.on_tick(101.0, 100.0, 100.5, ts=100) is None   # init high
+        assert eng.on_tick(100.8, 100.0, 100.5, ts=101) is None   # pullback
+        assert eng.on_tick(101.2, 100.0, 100.5, ts=102) == "CONTINUATION_UP"
+
+    def test_equal_to_high_does_not_fire(self):
+        eng = _engine("CALL")
+        eng.on_tick(101.0, 100.0, 100.5, ts=100)
+        assert eng.on_tick(101.0, 100.0, 100.5, ts=101) is None
+
+    def test_losing_vwap_resets_pullback(self):
+        eng = _engine("CALL")
+        eng.on_tick(101.0, 100.0, 100.5, ts=100)
+        eng.on_tick(99.5, 100.0, 100.5, ts=101)                   # below VWAP
+        assert math.isnan(eng.state.pullback_high)
+        assert eng.on_tick(100.5, 100.0, 100.5, ts=102) is None   # re-init
+
+
+class TestContinuationDown:
+    def test_breakdown_after_pullback_fires(self):
+        eng = _engine("PUT")
+        assert eng.on_tick(99.0, 100.0, 99.5, ts=100) is None
+        assert eng.on_tick(99.2, 100.0, 99.5, ts=101) is None
+        assert eng.on_tick(98.8, 100.0, 99.5, ts=102) == "CONTINUATION_DN"
+
+
+class TestCooldownAndFlags:
+    def test_cooldown_blocks_second_signal(self):
+        eng = _engine("CALL", cooldown_sec=20)
+        eng.on_tick(101.0, 100.0, 100.5, ts=100)
+        assert eng.on_tick(101.5, 100.0, 100.5, ts=101) == "CONTINUATION_UP"
+        eng.on_tick(101.0, 100.0, 100.5, ts=105)
+        assert eng.on_tick(102.0, 100.0, 100.5, ts=110) is None
+
+    def test_bias_flip_resets_pullback(self):
+        eng = _engine("CALL")
+        eng.on_tick(101.0, 100.0, 100.5, ts=100)
+        eng.update_trend_flags(_Mandate("PUT"))
+        assert math.isnan(eng.state.pullback_high)
+        assert eng.state.in_trend_dn is True
+
+    def test_no_bias_never_fires(self):
+        eng = _engine(None)
+        assert eng.on_tick(101.0, 100.0, 100.5, ts=100) is None
+        assert eng.on_tick(102.0, 100.0, 100.5, ts=101) is None
+
+
+class TestContinuationBook:
+    def test_rows_are_independent(self):
+        book = ContinuationBook(["SPY", "QQQ"])
+        book.update_trend_flags("SPY", _Mandate("CALL"))
+        book.update_trend_flags("QQQ", _Mandate("PUT"))
+
+        codes = book.on_ticks(
+            array("l", [0, 1, 0, 1]),
+            array("d", [101.0, 99.0, 101.5, 98.5]),
+            array("d", [100.0, 100.0, 100.0, 100.0]),
+            array("d", [100.5, 99.5, 100.5, 99.5]),
+            array("d", [100.0, 100.0, 101.0, 101.0]),
+        )
+        assert list(codes) == [0, 0, 1, 2]
+        assert book.last_signal_ts[0] == 101.0
+        assert math.isnan(book.pullback_high[0])
+
+    def test_on_tick_matches_engine(self):
+        book = ContinuationBook(["SPY"], cooldown_sec=20)
+        eng = _engine("CALL", cooldown_sec=20)
+        book.update_trend_flags("SPY", _Mandate("CALL"))
+
+        for price, ts in [(101.0, 100), (101.5, 101), (101.0, 105), (102.0, 110), (102.5, 125)]:
+            assert book.on_tick("SPY", price, 100.0, 100.5, ts) == eng.on_tick(price, 100.0, 100.5, ts)
@@ -102,3 +102,70 @@ class TestGrading:
         sig = e.qualify(snap)
         assert sig.grade == "A+"
         assert sig.trail_mult == 1.40
+
+
+class TestBuildSignalBatch:
+    @staticmethod
+    def _mandate(regime_type):
+        from bot_0dte.strategy.session_mandate import SessionMandate, RegimeState
+        return SessionMandate(
+            state=RegimeState.ENTRY_ALLOWED,
+            bias="CALL",
+            regime_type=regime_type,
+            confidence=0.8,
+            reason="test",
+        )
+
+    def test_batch_matches_scalar(self):
+        e = EliteEntryEngine()
+        rows = [
+            ("TREND", 0.0, 0.0),
+            ("TREND", 0.2, 0.06),
+            ("RECLAIM", -0.2, 0.0),
+            ("RECLAIM", 0.2, -0.06),
+            (None, 0.1, 0.06),
+        ]
+        scores, grades, trails = e.build_signal_batch(*zip(*rows))
+        for (regime, dev, slope), score, grade, trail in zip(rows, scores, grades, trails):
+            sig = e.build_signal(
+                self._mandate(regime),
+                {"vwap_dev": dev, "vwap_dev_change": slope},
+            )
+            assert (sig.score, sig.grade, sig.trail_mult) == (score, grade, trail)
+
+    def test_reclaim_with_both_boosts_is_a_plus(self):
+        scores, grades, trails = EliteEntryEngine().build_signal_batch(
+            ["RECLAIM"], [0.2], [0.06]
+        )
+        assert scores[0] == 95.0
+        assert grades[0] == "A+"
+        assert trails[0] == 1.40
+
+    def test_values_entry_matches_snap_entry(self):
+        e = EliteEntryEngine()
+        m = self._mandate("RECLAIM")
+        assert e.build_signal_values(m, 0.2, -0.06) == e.build_signal(
+            m, {"vwap_dev": 0.2, "vwap_dev_change": -0.06}
+        )
+
+
+class TestSignalRingBuffer:
+    def test_flush_writes_newest_rows_oldest_first(self):
+        import io
+        import json
+        from bot_0dte.strategy.elite_entry import EliteSignal, SignalRingBuffer
+
+        buf = SignalRingBuffer(capacity=2)
+        for ts, score in [(1.0, 60.0), (2.0, 75.0), (3.0, 95.0)]:
+            buf.append(ts, EliteSignal("CALL", "A", "RECLAIM", score, 1.30))
+        assert len(buf) == 2
+
+        out = io.StringIO()
+        assert buf.flush(out) == 2
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r["ts"] for r in rows] == [2.0, 3.0]
+        assert rows[1] == {
+            "ts": 3.0, "bias": "CALL", "grade": "A", "regime": "RECLAIM",
+            "score": 95.0, "trail_mult": 1.30,
+        }
+        assert len(buf) == 0
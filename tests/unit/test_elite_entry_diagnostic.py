@@ -0,0 +1,105 @@
+"""
+Unit tests for the diagnostic EliteEntryEngine (RECLAIM / TREND + Phase-1 filters).
+"""
+
+from bot_0dte.strategy.elite_entry_diagnostic import DiagnosticSnap, EliteEntryEngine
+
+# TREND snaps that clear every Phase-1 filter
+_TREND_UP = dict(price=100.05, vwap=100.0, vwap_dev=0.05, vwap_dev_change=0.01,
+                 upvol_pct=60, slope_prev=0.005, gamma=0.003, premium_ok=True)
+_TREND_DN = dict(price=99.95, vwap=100.0, vwap_dev=-0.05, vwap_dev_change=-0.01,
+                 upvol_pct=60, slope_prev=-0.02, gamma=0.003, premium_ok=True)
+
+
+def _qualify(engine=None, **snap):
+    return (engine or EliteEntryEngine()).qualify(DiagnosticSnap.from_dict(snap))
+
+
+class TestReclaim:
+    def test_call(self):
+        sig = _qualify(price=100.2, vwap=100.0, vwap_dev=0.2, vwap_dev_change=0.01)
+        assert (sig.bias, sig.regime, sig.grade) == ("CALL", "RECLAIM", "A")
+        assert (sig.score, sig.trail_mult) == (70.0, 1.25)
+
+    def test_put(self):
+        sig = _qualify(price=99.8, vwap=100.0, vwap_dev=-0.2, vwap_dev_change=-0.01)
+        assert (sig.bias, sig.regime, sig.score) == ("PUT", "RECLAIM", 70.0)
+
+    def test_skips_phase1_filters(self):
+        sig = _qualify(price=100.2, vwap=100.0, vwap_dev=0.2, vwap_dev_change=0.01, upvol_pct=10)
+        assert sig.regime == "RECLAIM"
+
+
+class TestTrend:
+    def test_trend_up(self):
+        sig = _qualify(**_TREND_UP)
+        assert (sig.bias, sig.regime, sig.grade) == ("CALL", "TREND_UP", "A")
+        assert (sig.score, sig.trail_mult) == (50.0, 1.25)
+
+    def test_trend_dn(self):
+        sig = _qualify(**_TREND_DN)
+        assert (sig.bias, sig.regime, sig.score) == ("PUT", "TREND_DN", 50.0)
+
+    def test_price_on_wrong_side_of_vwap_is_none(self):
+        assert _qualify(**{**_TREND_UP, "price": 99.95}) is None
+        assert _qualify(**{**_TREND_DN, "price": 100.05}) is None
+
+
+class TestPhase1Filters:
+    def test_upvol(self):
+        assert _qualify(**{**_TREND_UP, "upvol_pct": 50}) is None
+
+    def test_slope_acceleration(self):
+        assert _qualify(**{**_TREND_UP, "slope_prev": 0.01}) is None
+        assert _qualify(**{**_TREND_DN, "slope_prev": -0.005}) is None
+
+    def test_gamma(self):
+        assert _qualify(**{**_TREND_UP, "gamma": 0.002}) is None
+
+    def test_premium_ok(self):
+        assert _qualify(**{**_TREND_UP, "premium_ok": False}) is None
+
+    def test_disabled(self):
+        engine = EliteEntryEngine(enable_phase1_filters=False)
+        bare = dict(price=100.05, vwap=100.0, vwap_dev=0.05, vwap_dev_change=0.01)
+        assert _qualify(**bare) is None
+        sig = _qualify(engine, **bare)
+        assert (sig.bias, sig.regime) == ("CALL", "TREND_UP")
+
+
+class TestScoring:
+    def test_strong_slope_boost(self):
+        sig = _qualify(price=100.2, vwap=100.0, vwap_dev=0.2, vwap_dev_change=0.03)
+        assert (sig.score, sig.grade, sig.trail_mult) == (80.0, "A", 1.25)
+
+        sig = _qualify(**{**_TREND_DN, "vwap_dev_change": -0.03, "slope_prev": -0.05})
+        assert (sig.score, sig.grade) == (60.0, "A")
+
+    def test_a_plus_line_is_above_every_outcome(self):
+        # RECLAIM + strong slope tops out at 80: A+ (85) is not reachable
+        # with the current weights
+        assert EliteEntryEngine.BASE_RECLAIM + EliteEntryEngine.BOOST_STRONG_SLOPE < EliteEntryEngine.GRADE_A_PLUS
+
+
+class TestMissingInputs:
+    def test_from_dict_maps_missing_and_none_to_nan(self):
+        snap = DiagnosticSnap.from_dict({"price": 100.0, "gamma": None})
+        assert snap.price == 100.0
+        assert snap.gamma != snap.gamma and snap.vwap != snap.vwap
+        assert snap.premium_ok is False
+
+    def test_missing_required_fields_are_none(self):
+        assert _qualify(price=100.2, vwap=100.0, vwap_dev=0.2) is None
+        assert _qualify(price=100.2, vwap=100.0, vwap_dev_change=0.01) is None
+        assert _qualify(vwap=100.0, vwap_dev=0.2, vwap_dev_change=0.01) is None
+        assert _qualify(price=100.2, vwap_dev=0.2, vwap_dev_change=None) is None
+
+    def test_below_minimum_movement_is_none(self):
+        assert _qualify(price=100.2, vwap=100.0, vwap_dev=0.2, vwap_dev_change=0.0001) is None
+        assert _qualify(price=100.2, vwap=100.0, vwap_dev=0.005, vwap_dev_change=0.01) is None
+
+    def test_missing_phase1_inputs(self):
+        assert _qualify(**{**_TREND_UP, "upvol_pct": None}) is None
+        assert _qualify(**{**_TREND_UP, "gamma": None}) is None
+        # no slope_prev → acceleration check is skipped
+        assert _qualify(**{**_TREND_UP, "slope_prev": None}).regime == "TREND_UP"
@@ -515,5 +515,90 @@ class TestLimitPriceConstruction:
         assert result.limit_price == 0.95  # bid
 
 
+class TestValidateBatch:
+    """Test columnar batch validation against per-tick validate()."""
+
+    def test_batch_matches_validate(self):
+        """Each row gets the same reason / limit as validate()."""
+        from array import array
+        from math import nan
+        from bot_0dte.strategy._precheck_jit import REASONS
+
+        pc = EliteLatencyPrecheck()
+        ticks = [
+            # (bias, grade, price, bid, ask, bid_size, slope)
+            ("CALL", "A", 1.00, 0.95, 1.05, 10, 0.02),    # pass
+            ("PUT", "A+", 1.00, 0.95, 1.05, 10, -0.02),   # pass
+            ("CALL", "A", 1.00, 1.05, 1.05, 10, 0.02),    # locked
+            ("CALL", "A", 1.00, 0.95, 1.05, 2, 0.02),     # thin
+            ("PUT", "A", 1.00, 0.95, 1.05, None, 0.02),   # reversal
+        ]
+        codes, limits = pc.validate_batch(
+            ["SPY"] * len(ticks),
+            array("d", [t[2] for t in ticks]),
+            array("d", [t[3] for t in ticks]),
+            array("d", [t[4] for t in ticks]),
+            array("d", [nan if t[5] is None else t[5] for t in ticks]),
+            array("d", [10.0] * len(ticks)),
+            array("d", [t[6] for t in ticks]),
+            array("d", [0.5] * len(ticks)),
+            array("d", [nan] * len(ticks)),
+            array("d", [nan] * len(ticks)),
+            array("b", [1 if t[0] == "CALL" else -1 for t in ticks]),
+            array("b", [t[1] == "A+" for t in ticks]),
+        )
+
+        for i, (bias, grade, price, bid, ask, size, slope) in enumerate(ticks):
+            tick = {
+                "price": price, "bid": bid, "ask": ask,
+                "bid_size": size, "ask_size": 10,
+                "vwap_dev_change": slope, "_chain_age": 0.5,
+            }
+            result = pc.validate("SPY", tick, bias, grade)
+            assert REASONS[codes[i]] == result.reason
+            if result.ok:
+                assert limits[i] == result.limit_price
+
+
+class TestBind:
+    """Test symbol-bound validation."""
+
+    def test_bound_matches_validate(self):
+        """bind(symbol) gives the same results as validate(symbol, ...)."""
+        pc = EliteLatencyPrecheck()
+        check = pc.bind("SPY")
+        tick = {
+            "price": 1.00,
+            "bid": 0.95,
+            "ask": 1.05,
+            "bid_size": 10,
+            "ask_size": 10,
+            "vwap_dev_change": 0.02,
+            "_chain_age": 0.5,
+        }
+
+        assert check(tick, "CALL", "A") == pc.validate("SPY", tick, "CALL", "A")
+        tick["latency_ms"] = 10_000
+        assert check(tick, "CALL", "A").reason == "latency_exceeded"
+
+    def test_coded_matches_validate(self):
+        """validate_coded(+1/-1, a_plus) gives the same results as validate()."""
+        pc = EliteLatencyPrecheck()
+        tick = {
+            "price": 1.00,
+            "bid": 0.95,
+            "ask": 1.05,
+            "bid_size": 10,
+            "ask_size": 10,
+            "vwap_dev_change": 0.02,
+            "_chain_age": 0.5,
+        }
+        snap = {"upvol_pct": 50}
+
+        assert pc.validate_coded("SPY", tick, 1, False) == pc.validate("SPY", tick, "CALL", "A")
+        assert pc.validate_coded("SPY", tick, -1, True) == pc.validate("SPY", tick, "PUT", "A+")
+        assert pc.validate_coded("SPY", tick, 1, False, snap).reason == "weak_flow"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
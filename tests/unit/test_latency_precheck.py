@@ -0,0 +1,57 @@
+"""
+Unit tests for LatencyPrecheck (measurement-only).
+"""
+
+import math
+from array import array
+
+from bot_0dte.strategy.latency_precheck import LatencyPrecheck, LatencyTick
+
+
+class TestMeasure:
+    def test_call_metrics(self):
+        m = LatencyPrecheck().measure("SPY", LatencyTick(1.00, 0.95, 1.05, 0.02), "CALL")
+        assert m.error is None
+        assert m.limit_price == 1.05
+        assert math.isclose(m.spread_pct, 0.10)
+        assert math.isclose(m.slippage_pct, 0.05)
+        assert m.reversal_slope == 0.02
+
+    def test_missing_price_is_error(self):
+        m = LatencyPrecheck().measure("SPY", LatencyTick.from_dict({"bid": 0.95, "ask": 1.05}), "PUT")
+        assert m.error == "missing_prices"
+        assert m.limit_price is None
+
+    def test_coded_matches_measure(self):
+        lp = LatencyPrecheck()
+        tick = LatencyTick(1.00, 0.95, 1.05, 0.02)
+        assert lp.measure_coded("SPY", tick, 1) == lp.measure("SPY", tick, "CALL")
+        assert lp.measure_coded("SPY", tick, -1) == lp.measure("SPY", tick, "PUT")
+
+    def test_non_positive_price_is_error(self):
+        m = LatencyPrecheck().measure("SPY", LatencyTick(0.0, 0.95, 1.05), "CALL")
+        assert m.error == "non_positive_price"
+
+
+class TestMeasureBatch:
+    def test_batch_matches_measure(self):
+        lp = LatencyPrecheck()
+        rows = [
+            (1.00, 0.95, 1.05, 1),
+            (1.00, 0.95, 1.05, -1),
+            (math.nan, 0.95, 1.05, 1),
+            (1.00, 0.0, 1.05, -1),
+            (0.0, 0.95, 1.05, 1),
+        ]
+        spreads, slippages, limits, errors = lp.measure_batch(
+            array("d", [r[0] for r in rows]),
+            array("d", [r[1] for r in rows]),
+            array("d", [r[2] for r in rows]),
+            array("b", [r[3] for r in rows]),
+        )
+
+        assert list(errors) == [0, 0, 1, 2, 3]
+        for i, (price, bid, ask, sign) in enumerate(rows[:2]):
+            m = lp.measure("SPY", LatencyTick(price, bid, ask), "CALL" if sign == 1 else "PUT")
+            assert (spreads[i], slippages[i], limits[i]) == (m.spread_pct, m.slippage_pct, m.limit_price)
+        assert all(math.isnan(x) for x in limits[2:])
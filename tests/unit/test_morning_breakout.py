@@ -0,0 +1,49 @@
+"""
+Unit tests for MorningBreakout (early-entry / standard-mode VWAP breakout).
+"""
+
+import pytest
+
+from bot_0dte.strategy.morning_breakout import BreakoutSnap, MorningBreakout
+
+
+def _qualify(**snap):
+    return MorningBreakout().qualify(BreakoutSnap.from_dict(snap))
+
+
+class TestEarlyEntry:
+    def test_pre_reclaim_call_without_microstructure(self):
+        sig = _qualify(price=99.5, vwap=100.0, vwap_dev=-0.5, vwap_dev_change=0.01, seconds_since_open=600)
+        assert (sig["bias"], sig["regime"], sig["grade"], sig["vol_path"]) == ("CALL", "TREND_EARLY", "A Early", "NEUTRAL")
+        assert sig["tp_mult"] == 5.0
+
+    def test_signals_are_shared_read_only(self):
+        snap = dict(price=99.5, vwap=100.0, vwap_dev=-0.5, vwap_dev_change=0.01)
+        sig = _qualify(**snap)
+        assert _qualify(**snap) is sig
+        with pytest.raises(TypeError):
+            sig["tp_mult"] = 1.0
+
+    def test_vol_support_upgrades_grade(self):
+        sig = _qualify(price=100.5, vwap=100.0, vwap_dev=0.5, vwap_dev_change=-0.01,
+                       seconds_since_open=600, iv_change=0.1, skew_shift=0.1)
+        assert (sig["bias"], sig["grade"], sig["vol_path"]) == ("PUT", "A+ Early", "SUPPORT")
+
+    def test_vol_against_falls_through_to_standard_mode(self):
+        sig = _qualify(price=100.5, vwap=100.0, vwap_dev=0.5, vwap_dev_change=-0.01,
+                       seconds_since_open=600, iv_change=-0.1, skew_shift=-0.1)
+        assert sig is None  # dev > 0 with falling slope: neither reclaim nor reject
+
+
+class TestStandardMode:
+    def test_reclaim_when_microstructure_fails(self):
+        sig = _qualify(price=99.5, vwap=100.0, vwap_dev=0.2, vwap_dev_change=0.01,
+                       seconds_since_open=600, upvol_pct=40, flow_ratio=1.0)
+        assert (sig["bias"], sig["regime"], sig["grade"]) == ("CALL", "RECLAIM", "A")
+        assert sig["tp_mult"] == 3.0
+
+
+class TestGuards:
+    def test_missing_vwap_or_after_morning_is_none(self):
+        assert _qualify(price=99.5, vwap_dev=-0.5, vwap_dev_change=0.01) is None
+        assert _qualify(price=99.5, vwap=100.0, vwap_dev=-0.5, vwap_dev_change=0.01, seconds_since_open=6000) is None
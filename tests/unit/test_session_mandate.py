@@ -164,7 +164,7 @@ def test_acceptance_hold_bars():
     # Simulate time passing (hold bar accumulation happens in determine())
     # We need to manually advance the state for testing
     state = engine._get_acceptance_state("SPY")
-    state["hold_bars"] = 2  # Manually set to threshold
+    state.hold_bars = 2  # Manually set to threshold
     
     # Next tick: ENTRY_ALLOWED (hold bars met)
     m2 = engine.determine("SPY", snap)
@@ -193,7 +193,7 @@ def test_acceptance_range_break():
     
     # Get state and set range_high manually
     state = engine._get_acceptance_state("SPY")
-    state["range_high"] = 100.5
+    state.range_high = 100.5
     
     # New tick with higher price (range break)
     snap2 = {
@@ -257,7 +257,7 @@ def test_bias_flip_resets_acceptance():
     
     # Manually add hold bars
     state = engine._get_acceptance_state("SPY")
-    state["hold_bars"] = 2
+    state.hold_bars = 2
     
     # Flip to PUT
     snap_put = {
@@ -273,7 +273,7 @@ def test_bias_flip_resets_acceptance():
     
     # Hold bars should be reset
     state = engine._get_acceptance_state("SPY")
-    assert state["hold_bars"] == 0, "Hold bars should reset on bias flip"
+    assert state.hold_bars == 0, "Hold bars should reset on bias flip"
     
     # Should be SUPPRESSED again
     assert m2.state == RegimeState.SUPPRESSED